@@ -122,8 +122,9 @@ def install_dbx_patch(use_uv: bool = True) -> None:
 
     if use_uv:
         print("Installing dbx-patch using uv...")
+        # uv skips bytecode compilation by default; precompile so patch modules load from .pyc at startup
         run_command(
-            ["uv", "pip", "install", "dbx-patch"],
+            ["uv", "pip", "install", "--compile-bytecode", "dbx-patch"],
             "Install dbx-patch with uv",
         )
     else:
@@ -32,7 +32,8 @@ fi
 
 # Step 2: Install dbx-patch
 print_section "Step 2: Installing dbx-patch"
-uv pip install dbx-patch
+# uv skips bytecode compilation by default; precompile so patch modules load from .pyc at startup
+uv pip install --compile-bytecode dbx-patch
 echo "✓ dbx-patch installed"
 
 # Step 3: Apply patches
@@ -4,11 +4,12 @@ Provides abstract base classes and singleton metaclass for all patches.
 """
 
 from abc import ABCMeta, abstractmethod
-import contextlib
 import threading
 from typing import Any
 
 from dbx_patch.models import PatchResult
+from dbx_patch.pth_processor import get_editable_install_paths
+from dbx_patch.utils.logger import get_enabled_logger
 
 
 class SingletonMeta(ABCMeta):
@@ -52,8 +53,8 @@ class BasePatch(metaclass=SingletonMeta):
     Attributes:
         _is_applied: Whether the patch has been applied
         _original_target: Reference to original function/method for restoration
-        _cached_editable_paths: Set of cached editable install paths (if applicable)
-        _logger: Cached logger instance
+        _cached_editable_paths: Frozen set of cached editable install paths (if applicable)
+        _sorted_editable_paths: The cached editable paths as a sorted tuple; results receive list copies
     """
 
     def __init__(self, verbose: bool = True) -> None:
@@ -64,22 +65,20 @@ class BasePatch(metaclass=SingletonMeta):
         """
         self._is_applied: bool = False
         self._original_target: Any = None
-        self._cached_editable_paths: set[str] = set()
+        self._cached_editable_paths: frozenset[str] = frozenset()
+        self._sorted_editable_paths: tuple[str, ...] = ()
         self._verbose: bool = verbose
-        self._logger: Any = None
 
     def _get_logger(self) -> Any:
-        """Get lazily-initialized logger instance.
+        """Get the default logger, resolved once per process.
+
+        A disabled logger is returned as None, so ``if logger:`` call sites skip
+        building their messages altogether.
 
         Returns:
-            Logger instance or None if unavailable
+            Logger instance, or None if disabled
         """
-        if self._logger is None:
-            with contextlib.suppress(Exception):
-                from dbx_patch.utils.logger import get_logger
-
-                self._logger = get_logger()
-        return self._logger
+        return get_enabled_logger()
 
     def _detect_editable_paths(self) -> set[str]:
         """Detect editable install paths from pth_processor.
@@ -88,8 +87,6 @@ class BasePatch(metaclass=SingletonMeta):
             Set of absolute paths to editable install directories
         """
         try:
-            from dbx_patch.pth_processor import get_editable_install_paths
-
             return get_editable_install_paths()
         except Exception:
             return set()
@@ -135,22 +132,37 @@ class BasePatch(metaclass=SingletonMeta):
         """
         ...
 
+    def _set_editable_paths(self, paths: set[str]) -> None:
+        """Replace the cached editable paths (override to rebuild derived lookups).
+
+        The paths are published as a new frozenset rather than mutated in place, so
+        hooks reading the previous snapshot never see it change size mid-iteration.
+
+        Args:
+            paths: Set of absolute paths to editable install directories
+        """
+        self._cached_editable_paths = frozenset(paths)
+        self._sorted_editable_paths = tuple(sorted(paths))
+
     def refresh_paths(self) -> int:
         """Refresh cached editable install paths (optional, override if needed).
 
         Returns:
             Number of editable paths detected
         """
-        self._cached_editable_paths = self._detect_editable_paths()
+        self._set_editable_paths(self._detect_editable_paths())
         return len(self._cached_editable_paths)
 
-    def get_editable_paths(self) -> set[str]:
+    def get_editable_paths(self) -> frozenset[str]:
         """Get current cached editable paths (optional, override if needed).
 
+        The cached snapshot is returned directly; it is immutable and replaced as a
+        whole on refresh, so no defensive copy is needed.
+
         Returns:
-            Set of editable install paths
+            Frozen set of editable install paths
         """
-        return self._cached_editable_paths.copy()
+        return self._cached_editable_paths
 
     @classmethod
     def reset(cls) -> None:
@@ -166,7 +178,6 @@ class BaseVerification(metaclass=SingletonMeta):
 
     Attributes:
         _is_verified: Whether verification has been performed
-        _logger: Cached logger instance
     """
 
     def __init__(self, verbose: bool = True) -> None:
@@ -177,20 +188,17 @@ class BaseVerification(metaclass=SingletonMeta):
         """
         self._is_verified: bool = False
         self._verbose: bool = verbose
-        self._logger: Any = None
 
     def _get_logger(self) -> Any:
-        """Get lazily-initialized logger instance.
+        """Get the default logger, resolved once per process.
+
+        A disabled logger is returned as None, so ``if logger:`` call sites skip
+        building their messages altogether.
 
         Returns:
-            Logger instance or None if unavailable
+            Logger instance, or None if disabled
         """
-        if self._logger is None:
-            with contextlib.suppress(Exception):
-                from dbx_patch.utils.logger import get_logger
-
-                self._logger = get_logger()
-        return self._logger
+        return get_enabled_logger()
 
     @abstractmethod
     def verify(self) -> PatchResult:
@@ -15,7 +15,10 @@ Usage:
     install_sitecustomize()
 """
 
+import contextlib
+import importlib.util
 from pathlib import Path
+import py_compile
 import sys
 
 from dbx_patch.models import SitecustomizeStatus
@@ -121,7 +124,8 @@ def install_sitecustomize(force: bool = True, restart_python: bool = True) -> bo
         sitecustomize_path = site_packages / "sitecustomize.py"
 
         # Check if already exists
-        if sitecustomize_path.exists() and not force:
+        already_exists = sitecustomize_path.exists()
+        if already_exists and not force:
             logger.warning(f"sitecustomize.py already exists: {sitecustomize_path}")
             with logger.indent():
                 logger.info("Use force=True to overwrite")
@@ -129,11 +133,12 @@ def install_sitecustomize(force: bool = True, restart_python: bool = True) -> bo
             return False
 
         # Backup existing file if it exists
-        if sitecustomize_path.exists():
+        if already_exists:
             backup_path = site_packages / "sitecustomize.py.backup"
             logger.info(f"Backing up existing file to: {backup_path}")
             try:
-                sitecustomize_path.rename(backup_path)
+                # replace() is a metadata-only move that, unlike rename(), also overwrites an old backup on Windows
+                sitecustomize_path.replace(backup_path)
             except OSError as e:
                 logger.error(f"Failed to backup existing file: {e}")  # noqa: TRY400
                 return False
@@ -143,6 +148,10 @@ def install_sitecustomize(force: bool = True, restart_python: bool = True) -> bo
             content = get_sitecustomize_content()
             sitecustomize_path.write_text(content, encoding="utf-8")
 
+            # Precompile so interpreter startup loads the cached bytecode instead of parsing the source
+            with contextlib.suppress(py_compile.PyCompileError, OSError):
+                py_compile.compile(str(sitecustomize_path), doraise=True)
+
             logger.success(f"sitecustomize.py installed: {sitecustomize_path}")
             logger.blank()
             logger.info("✅ Installation complete!")
@@ -230,12 +239,13 @@ def uninstall_sitecustomize() -> bool:
         # Remove the file
         try:
             sitecustomize_path.unlink()
+            Path(importlib.util.cache_from_source(str(sitecustomize_path))).unlink(missing_ok=True)
             logger.success("sitecustomize.py removed")
 
             # Restore backup if it exists
             backup_path = site_packages / "sitecustomize.py.backup"
             if backup_path.exists():
-                backup_path.rename(sitecustomize_path)
+                backup_path.replace(sitecustomize_path)
                 logger.info("Restored backup file")
 
             return True
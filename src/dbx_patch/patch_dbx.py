@@ -13,6 +13,7 @@ Or for comprehensive setup with auto-patching on restart:
     patch_and_install()
 """
 
+import logging
 import sys
 from typing import Any
 
@@ -50,16 +51,17 @@ def patch_dbx(force_refresh: bool = False) -> ApplyPatchesResult:
     logger.debug("patch_dbx() called")
     logger.debug(f"force_refresh={force_refresh}")
 
-    # Display runtime version info
-    version_info = get_runtime_version_info()
-    if version_info["is_databricks"]:
-        logger.debug(f"Databricks Runtime Version: {version_info['raw']}")
-        logger.debug(
-            f"Using patches for DBR {'>=18.0' if version_info['major'] and version_info['major'] >= 18 else '<18.0'}"
-        )
-    else:
-        logger.debug("Not running in Databricks (or version detection failed)")
-        logger.debug("Assuming modern runtime (>=18.0) for local testing")
+    # Display runtime version info; only gathered when the debug output will be shown
+    if logger.is_enabled_for(logging.DEBUG):
+        version_info = get_runtime_version_info()
+        if version_info["is_databricks"]:
+            logger.debug(f"Databricks Runtime Version: {version_info['raw']}")
+            logger.debug(
+                f"Using patches for DBR {'>=18.0' if version_info['major'] and version_info['major'] >= 18 else '<18.0'}"
+            )
+        else:
+            logger.debug("Not running in Databricks (or version detection failed)")
+            logger.debug("Assuming modern runtime (>=18.0) for local testing")
 
     with logger.section("DBX-Patch: Enabling editable install support"):
         sys_path_init_result = None
@@ -199,10 +201,7 @@ def patch_dbx(force_refresh: bool = False) -> ApplyPatchesResult:
             logger.warning("No patches were applied successfully")
 
         if all_paths:
-            logger.info(f"Detected {len(all_paths)} editable install path(s):")
-            with logger.indent():
-                for path in sorted(all_paths):
-                    logger.info(f"- {path}")
+            logger.bullets(f"Detected {len(all_paths)} editable install path(s):", sorted(all_paths))
         else:
             logger.warning("No editable install paths detected")
             with logger.indent():
@@ -20,10 +20,12 @@ Example:
 
 import builtins
 import logging
+import os
 from typing import Any
 
 from dbx_patch.base_patch import BasePatch
 from dbx_patch.models import PatchResult
+from dbx_patch.pth_processor import get_editable_install_paths
 
 
 class AutoreloadHookPatch(BasePatch):
@@ -43,6 +45,8 @@ class AutoreloadHookPatch(BasePatch):
         self._registered_check: Any = None
         self._original_builtins_import: Any = None
         self._import_patch_applied: bool = False
+        # Logger for import tracing, resolved when builtins.__import__ is patched; None when DEBUG is off
+        self._trace_logger: Any = None
 
     def _editable_path_check(self, fname: str) -> bool:
         """Check if a file path is within an editable install directory.
@@ -56,18 +60,16 @@ class AutoreloadHookPatch(BasePatch):
         if not fname:
             return False
 
-        from dbx_patch.pth_processor import get_editable_install_paths
-
         editable_paths = get_editable_install_paths()
 
-        # Check if the file is under any editable install path
-        result = any(fname.startswith(editable_path) for editable_path in editable_paths)
+        # Check if the file is under any editable install path (str.startswith tests the whole tuple in C)
+        result = fname.startswith(tuple(editable_paths))
 
         # Debug logging
         logger = self._get_logger()
         if logger and result:
-            matching = [p for p in editable_paths if fname.startswith(p)]
-            logger.debug(f"Autoreload check: {fname} -> {result} (matched: {matching[0] if matching else 'unknown'})")
+            matched = next((p for p in editable_paths if fname.startswith(p)), "unknown")
+            logger.debug(f"Autoreload check: {fname} -> {result} (matched: {matched})")
 
         return result
 
@@ -84,9 +86,9 @@ class AutoreloadHookPatch(BasePatch):
         Returns:
             The imported module
         """
-        logger = self._get_logger()
+        logger = self._trace_logger
         if logger:
-            logger.debug(f"Importing: {name} (args={args}, kwargs={kwargs})")
+            logger.debug("Importing: %s (args=%s, kwargs=%s)", name, args, kwargs)
 
         if self._original_builtins_import is None:
             msg = "Original builtins.__import__ not saved"
@@ -96,12 +98,11 @@ class AutoreloadHookPatch(BasePatch):
             result = self._original_builtins_import(name, *args, **kwargs)
         except Exception as e:
             if logger:
-                logger.debug(f"Import FAILED: {name} - {e}")
+                logger.debug("Import FAILED: %s - %s", name, e)
             raise
         else:
             if logger:
-                module_file = getattr(result, "__file__", "<no __file__>")
-                logger.debug(f"Import succeeded: {name} from {module_file}")
+                logger.debug("Import succeeded: %s from %s", name, getattr(result, "__file__", "<no __file__>"))
             return result
 
     def patch(self) -> PatchResult:
@@ -114,14 +115,14 @@ class AutoreloadHookPatch(BasePatch):
 
         # Patch builtins.__import__ for debug logging ONLY if explicitly enabled via env var
         # This is extremely verbose and should only be used for debugging import issues
-        import os
-
         if (
-            os.environ.get("DBX_PATCH_DEBUG_IMPORTS", "").lower() in ("1", "true", "yes")
+            os.environ.get("DBX_PATCH_DEBUG_IMPORTS", "").lower() in {"1", "true", "yes"}
             and not self._import_patch_applied
         ):
             if logger:
                 logger.info("DBX_PATCH_DEBUG_IMPORTS enabled - patching builtins.__import__ for import tracing...")
+            # Resolve the DEBUG gate once; the wrapper runs on every import in the process
+            self._trace_logger = logger if logger and logger.is_enabled_for(logging.DEBUG) else None
             self._original_builtins_import = builtins.__import__
             builtins.__import__ = self._patched_builtins_import  # type: ignore[assignment]
             self._import_patch_applied = True
@@ -131,8 +132,6 @@ class AutoreloadHookPatch(BasePatch):
         if self._is_applied:
             if logger:
                 logger.info("Autoreload hook patch already applied.")
-            from dbx_patch.pth_processor import get_editable_install_paths
-
             editable_paths = get_editable_install_paths()
             return PatchResult(
                 success=True,
@@ -151,8 +150,6 @@ class AutoreloadHookPatch(BasePatch):
             if logger:
                 logger.info("Autoreload file_module_utils found, registering editable path check...")
 
-            from dbx_patch.pth_processor import get_editable_install_paths
-
             editable_paths = get_editable_install_paths()
 
             if logger:
@@ -190,9 +187,7 @@ class AutoreloadHookPatch(BasePatch):
                 logger.success("Autoreload hook patched successfully!")
                 if editable_paths:
                     with logger.indent():
-                        logger.info("Allowing imports from editable paths:")
-                        for path in sorted(editable_paths):
-                            logger.info(f"- {path}")
+                        logger.bullets("Allowing imports from editable paths:", sorted(editable_paths))
                 else:
                     with logger.indent():
                         logger.warning("No editable install paths found yet.")
@@ -9,7 +9,9 @@ lost during these updates.
 """
 
 from collections.abc import Callable
+import logging
 import sys
+from types import ModuleType
 from typing import Any
 
 from dbx_patch.base_patch import BasePatch
@@ -32,30 +34,34 @@ class PythonPathHookPatch(BasePatch):
         Returns:
             Patched method that preserves editable paths
         """
-
-        def patched_handle_sys_path_maybe_updated(hook_self: Any) -> None:
-            logger = self._get_logger()
-            if logger:
+        # Resolve the logger once so the hook only pays for debug output when it is enabled
+        logger = self._get_logger()
+        debug_enabled = bool(logger) and logger.is_enabled_for(logging.DEBUG)
+
+        # Globals are bound as keyword-only defaults so the hook body resolves them as fast locals.
+        # sys.path itself is not frozen because the runtime may rebind it to a new list.
+        def patched_handle_sys_path_maybe_updated(
+            hook_self: Any, *, _sys: ModuleType = sys, _sorted: Callable[..., list[str]] = sorted
+        ) -> None:
+            if debug_enabled:
                 logger.debug("PythonPathHook._handle_sys_path_maybe_updated called (PATCHED)")
 
             # Call original method first
             original_method(hook_self)
 
             # Ensure all editable paths are still in sys.path
-            if self._cached_editable_paths:
-                paths_to_restore = []
-                for editable_path in self._cached_editable_paths:
-                    if editable_path not in sys.path:
-                        paths_to_restore.append(editable_path)
-
-                if paths_to_restore and logger:
-                    logger.debug(f"PythonPathHook: Restoring {len(paths_to_restore)} editable path(s) to sys.path")
+            editable_paths = self._cached_editable_paths
+            if editable_paths:
+                # set.difference hashes sys.path once in C; sort for a deterministic restore order
+                paths_to_restore = _sorted(editable_paths.difference(_sys.path))
+
+                if paths_to_restore and debug_enabled:
+                    logger.debug("PythonPathHook: Restoring %d editable path(s) to sys.path", len(paths_to_restore))
                     for path in paths_to_restore:
-                        logger.debug(f"PythonPathHook: Restoring path: {path}")
+                        logger.debug("PythonPathHook: Restoring path: %s", path)
 
                 # Restore missing paths (append to end to not interfere with workspace paths)
-                for path in paths_to_restore:
-                    sys.path.append(path)
+                _sys.path.extend(paths_to_restore)
 
         return patched_handle_sys_path_maybe_updated
 
@@ -74,7 +80,7 @@ class PythonPathHookPatch(BasePatch):
                 success=True,
                 already_patched=True,
                 editable_paths_count=len(self._cached_editable_paths),
-                editable_paths=sorted(self._cached_editable_paths),
+                editable_paths=list(self._sorted_editable_paths),
                 hook_found=True,
             )
 
@@ -83,7 +89,7 @@ class PythonPathHookPatch(BasePatch):
             from dbruntime.pythonPathHook import PythonPathHook  # type: ignore[import-not-found]
 
             # Detect editable paths
-            self._cached_editable_paths = self._detect_editable_paths()
+            self._set_editable_paths(self._detect_editable_paths())
 
             if logger:
                 logger.info(
@@ -108,20 +114,19 @@ class PythonPathHookPatch(BasePatch):
             PythonPathHook._handle_sys_path_maybe_updated = patched_method
 
             self._is_applied = True
+            sorted_paths = self._sorted_editable_paths
 
             if logger:
                 logger.success("PythonPathHook patched successfully!")
-                if self._cached_editable_paths:
+                if sorted_paths:
                     with logger.indent():
-                        logger.info("Preserving editable paths:")
-                        for path in sorted(self._cached_editable_paths):
-                            logger.info(f"- {path}")
+                        logger.bullets("Preserving editable paths:", sorted_paths)
 
             return PatchResult(
                 success=True,
                 already_patched=False,
-                editable_paths_count=len(self._cached_editable_paths),
-                editable_paths=sorted(self._cached_editable_paths),
+                editable_paths_count=len(sorted_paths),
+                editable_paths=list(sorted_paths),
                 hook_found=True,
             )
 
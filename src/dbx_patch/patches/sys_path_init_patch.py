@@ -8,10 +8,12 @@ hooks into Databricks' existing sys.path initialization logic.
 """
 
 from collections.abc import Callable
+import logging
 from typing import Any
 
 from dbx_patch.base_patch import BasePatch
-from dbx_patch.models import PatchResult
+from dbx_patch.models import PatchResult, PthProcessingResult
+from dbx_patch.pth_processor import process_all_pth_files
 
 
 class SysPathInitPatch(BasePatch):
@@ -30,10 +32,14 @@ class SysPathInitPatch(BasePatch):
         Returns:
             Patched function that includes .pth file processing
         """
+        # Resolve the logger once so the patched function only pays for debug output when it is enabled
+        logger = self._get_logger()
+        debug_enabled = bool(logger) and logger.is_enabled_for(logging.DEBUG)
 
-        def patched_patch_sys_path_with_developer_paths() -> None:
-            logger = self._get_logger()
-            if logger:
+        def patched_patch_sys_path_with_developer_paths(
+            *, _process_all_pth_files: Callable[..., PthProcessingResult] = process_all_pth_files
+        ) -> None:
+            if debug_enabled:
                 logger.debug("sys_path_init.patch_sys_path_with_developer_paths called (PATCHED)")
 
             # First, call the original function
@@ -41,15 +47,13 @@ class SysPathInitPatch(BasePatch):
 
             # Then, process .pth files to add editable install paths
             try:
-                from dbx_patch.pth_processor import process_all_pth_files
-
-                if logger:
+                if debug_enabled:
                     logger.debug("sys_path_init: Processing .pth files for editable installs")
 
                 # Process quietly to avoid verbose output during initialization
-                result = process_all_pth_files(force=False)
+                result = _process_all_pth_files(force=False)
 
-                if logger:
+                if debug_enabled:
                     logger.debug(f"sys_path_init: Added {result.paths_added} editable paths to sys.path")
             except Exception:  # noqa: S110
                 # Fail silently to not break Databricks initialization
@@ -15,15 +15,146 @@ This patch extends the whitelist to include editable install paths detected
 from .pth files and .egg-link files.
 """
 
-from collections.abc import Callable
-import inspect
+from bisect import bisect_right
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+import logging
+import os
+import re
 import sys
+from types import CodeType, FrameType
 from typing import Any
 
 from dbx_patch.base_patch import BasePatch
 from dbx_patch.models import PatchResult
 from dbx_patch.utils.runtime_version import is_runtime_version_gte
 
+# Per-frame verdicts are cached by code object; the cache is dropped once it grows past this size
+_FRAME_DECISION_CACHE_SIZE = 4096
+# Verdicts are kept per (allow list, site-packages) snapshot; more snapshots than this drop them all
+_SNAPSHOT_CACHE_SIZE = 8
+_UNDECIDED = object()
+# Filenames of CPython's frozen import machinery; get_filename is never needed for these.
+# Other synthetic names such as "<string>" are left to get_filename, which may map them via the frame's __file__.
+_FROZEN_IMPORT_FILENAMES = frozenset({"<frozen importlib._bootstrap>", "<frozen importlib._bootstrap_external>"})
+# From this many prefixes a binary search beats str.startswith scanning the whole tuple;
+# timed through _has_prefix on CPython 3.12, hits and misses both break even at 44-48 prefixes
+_BISECT_MIN_PREFIXES = 48
+
+
+def _remember_decision(frame_decisions: dict[CodeType, bool | None], code: CodeType, decision: bool | None) -> None:
+    """Cache the verdict for a code object, bounding the cache size.
+
+    Args:
+        frame_decisions: Cache mapping code objects to verdicts
+        code: Code object of the inspected frame
+        decision: True to allow, False to block, None to keep walking the stack
+    """
+    if len(frame_decisions) >= _FRAME_DECISION_CACHE_SIZE:
+        frame_decisions.clear()
+    frame_decisions[code] = decision
+
+
+def _snapshot_decisions(
+    snapshot_decisions: dict[tuple[tuple[str, ...], tuple[str, ...]], dict[CodeType, bool | None]],
+    snapshot: tuple[tuple[str, ...], tuple[str, ...]],
+) -> dict[CodeType, bool | None]:
+    """Get the verdict cache for a hook's allow list and site-packages snapshot.
+
+    A verdict only holds for the lists it was computed from, so hooks with
+    different lists, or one hook whose lists changed, never share verdicts.
+
+    Args:
+        snapshot_decisions: Cache mapping snapshots to their verdict caches
+        snapshot: The hook's allow list and site-packages list as tuples
+
+    Returns:
+        Verdict cache for the snapshot, created empty if it is new
+    """
+    frame_decisions = snapshot_decisions.get(snapshot)
+    if frame_decisions is None:
+        if len(snapshot_decisions) >= _SNAPSHOT_CACHE_SIZE:
+            snapshot_decisions.clear()
+        frame_decisions = snapshot_decisions[snapshot] = {}
+    return frame_decisions
+
+
+@lru_cache(maxsize=8)
+def _substring_pattern(items: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile substring allow-list entries into a single alternation pattern.
+
+    One ``search`` scans the filename in C instead of running a Python-level
+    ``in`` test per entry. Compiled patterns are cached by the entries, which
+    come from the runtime's class-level lists and rarely change.
+
+    Args:
+        items: Substrings that allow an import when found in a filename
+
+    Returns:
+        Compiled pattern matching any of the entries
+    """
+    return re.compile("|".join(map(re.escape, items)))
+
+
+def _compile_prefixes(paths: Iterable[str]) -> tuple[str, ...]:
+    """Compile paths into a sorted, prefix-free tuple for ``str.startswith`` matching.
+
+    Each path is terminated with a separator so ``/repo/pkg`` cannot match
+    ``/repo/pkg_other/mod.py``, and interned since it is compared on every import.
+    A path nested under another path can never match anything the outer one
+    doesn't, so it is dropped to keep the tuple as short as possible.
+
+    Args:
+        paths: Absolute editable install paths
+
+    Returns:
+        Sorted tuple of separator-terminated prefixes
+    """
+    prefixes: list[str] = []
+    for path in sorted({path.rstrip(os.sep) + os.sep for path in paths}):
+        if not prefixes or not path.startswith(prefixes[-1]):
+            prefixes.append(sys.intern(path))
+    return tuple(prefixes)
+
+
+def _match_prefix(prefixes: tuple[str, ...], filename: str) -> str | None:
+    """Find the prefix a filename starts with using binary search.
+
+    In a sorted, prefix-free tuple (see ``_compile_prefixes``) the only possible
+    match is the greatest prefix that sorts at or before the filename.
+
+    Args:
+        prefixes: Tuple built by ``_compile_prefixes``
+        filename: File path to test
+
+    Returns:
+        The matching prefix, or None if the filename is not under any prefix
+    """
+    index = bisect_right(prefixes, filename)
+    if index:
+        prefix = prefixes[index - 1]
+        if filename.startswith(prefix):
+            return prefix
+    return None
+
+
+def _has_prefix(prefixes: tuple[str, ...], filename: str) -> bool:
+    """Check whether a filename starts with any of the prefixes.
+
+    Small tuples are tested with a single ``str.startswith`` call, which scans
+    them linearly in C. Large ones switch to the O(log n) ``_match_prefix``.
+
+    Args:
+        prefixes: Tuple built by ``_compile_prefixes``
+        filename: File path to test
+
+    Returns:
+        True if the filename is under any prefix
+    """
+    if len(prefixes) >= _BISECT_MIN_PREFIXES:
+        return _match_prefix(prefixes, filename) is not None
+    return filename.startswith(prefixes)
+
 
 class WsfsImportHookPatch(BasePatch):
     """Patch for workspace import machinery.
@@ -32,130 +163,173 @@ class WsfsImportHookPatch(BasePatch):
     imports from editable install paths.
     """
 
-    def _create_patched_is_user_import_legacy(self, original_method: Callable[..., bool]) -> Callable[..., bool]:
-        """Create patched version for WsfsImportHook (DBR < 18.0).
+    def __init__(self, verbose: bool = True) -> None:
+        """Initialize the patch.
 
         Args:
-            original_method: The original __is_user_import method
+            verbose: Enable verbose logging
+        """
+        super().__init__(verbose)
+        self._editable_prefixes: tuple[str, ...] = ()
+        self._frame_decisions: dict[tuple[tuple[str, ...], tuple[str, ...]], dict[CodeType, bool | None]] = {}
+        # Which hook variant patch() replaced, so remove() restores the same one
+        self._patched_modern: bool = False
+
+    def _set_editable_paths(self, paths: set[str]) -> None:
+        """Replace the cached editable paths and recompile the prefix matcher.
+
+        Args:
+            paths: Set of absolute paths to editable install directories
+        """
+        super()._set_editable_paths(paths)
+        self._editable_prefixes = _compile_prefixes(paths)
+        # Verdicts depend on the editable paths, so start from a fresh cache
+        self._frame_decisions = {}
+
+    def _create_patched_is_user_import(
+        self,
+        original_method: Callable[..., bool],
+        *,
+        hook_name: str,
+        allow_list_attr: str,
+        site_packages_attr: str,
+        max_depth_attr: str,
+        error_result: bool,
+    ) -> Callable[..., bool]:
+        """Create a patched user-import check for either import hook variant.
+
+        Both runtime hooks walk the stack the same way and differ only in attribute
+        names and in what they return when the check itself fails.
+
+        Args:
+            original_method: The original user-import method
+            hook_name: Qualified name of the patched method, used in log messages
+            allow_list_attr: Name of the hook's substring allow-list attribute
+            site_packages_attr: Name of the hook's site-packages list attribute
+            max_depth_attr: Name of the hook's stack depth limit attribute
+            error_result: Verdict returned if the stack walk raises
 
         Returns:
             Patched method that includes editable path checking
         """
+        # Resolve the logger once so the hook only pays for debug output when it is enabled
+        logger = self._get_logger()
+        debug_enabled = bool(logger) and logger.is_enabled_for(logging.DEBUG)
+        warning_enabled = bool(logger) and logger.is_enabled_for(logging.WARNING)
+        hook_class = hook_name.partition(".")[0]
 
-        def patched_is_user_import(hook_self: Any) -> bool:
-            logger = self._get_logger()
-            if logger:
-                logger.debug("WsfsImportHook.__is_user_import called (PATCHED)")
+        def patched_is_user_import(hook_self: Any, *, _getframe: Callable[[int], FrameType] = sys._getframe) -> bool:
+            if not self._editable_prefixes:
+                # Nothing to allow beyond the stock behavior, so skip the patched stack walk
+                return original_method(hook_self)
 
-            try:
-                f = inspect.currentframe()
-                num_items_processed = 0
+            if debug_enabled:
+                logger.debug("%s called (PATCHED)", hook_name)
 
-                while f is not None:
-                    # Prevent infinite loops
-                    if num_items_processed >= hook_self._WsfsImportHook__max_recursion_depth:
-                        return True
+            # Start at this frame, as the stock hooks' own frame lookups do, so verdicts match them
+            frame = _getframe(0)
+            num_items_processed = 0
+            editable_prefixes = self._editable_prefixes
 
-                    filename = hook_self.get_filename(f)
+            # Only the runtime's hook attributes and get_filename can fail; they stay inside the fail-open guard
+            try:
+                # Resolve hook attributes once so the frame loop reads locals, not instance attributes
+                allow_list = tuple(getattr(hook_self, allow_list_attr))
+                site_packages = tuple(getattr(hook_self, site_packages_attr))
+                max_depth = getattr(hook_self, max_depth_attr)
+                get_filename = hook_self.get_filename
+                frame_decisions = _snapshot_decisions(self._frame_decisions, (allow_list, site_packages))
 
-                    # Allow whitelisted paths (existing behavior)
-                    allow_import = any(
-                        whitelisted_item in filename for whitelisted_item in hook_self.SITE_PACKAGE_WHITE_LIST
-                    )
-                    if allow_import:
+                while frame is not None:
+                    # Prevent infinite loops
+                    if num_items_processed >= max_depth:
                         return True
 
-                    # NEW: Allow imports from editable install paths
-                    if self._cached_editable_paths:
-                        is_editable_path = any(
-                            filename.startswith(editable_path) for editable_path in self._cached_editable_paths
-                        )
-                        if is_editable_path and logger:
-                            matching = [p for p in self._cached_editable_paths if filename.startswith(p)]
-                            logger.debug(
-                                f"WsfsImportHook: Allowing import from editable path: {filename} (matched: {matching[0] if matching else 'unknown'})"
-                            )
-                            return True
-
-                    # Check if from site-packages (existing behavior)
-                    is_site_packages = any(
-                        filename.startswith(package) for package in hook_self._WsfsImportHook__site_packages
-                    )
-                    if is_site_packages:
-                        return False
+                    code = frame.f_code
+                    decision = frame_decisions.get(code, _UNDECIDED)
+                    if decision is _UNDECIDED:
+                        if code.co_filename in _FROZEN_IMPORT_FILENAMES:
+                            # Import machinery frames have no file on disk, so no path check can match them
+                            decision = None
+                        else:
+                            filename = get_filename(frame)
+
+                            # Both allow checks return True, so the C-level prefix test runs before the substring scan
+                            if _has_prefix(editable_prefixes, filename):
+                                # NEW: Allow imports from editable install paths
+                                if debug_enabled:
+                                    logger.debug(
+                                        "%s: Allowing import from editable path: %s (matched: %s)",
+                                        hook_class,
+                                        filename,
+                                        _match_prefix(editable_prefixes, filename),
+                                    )
+                                decision = True
+                            elif allow_list and _substring_pattern(allow_list).search(filename):
+                                # Allow whitelisted paths (existing behavior)
+                                decision = True
+                            elif filename.startswith(site_packages):
+                                # Check if from site-packages (existing behavior)
+                                decision = False
+                            else:
+                                decision = None
+
+                        _remember_decision(frame_decisions, code, decision)
+
+                    if decision is not None:
+                        return decision
 
                     num_items_processed += 1
-                    f = f.f_back
+                    frame = frame.f_back
 
                 # None of the stack frames are from site-packages, probably from user
                 return True
 
             except Exception as e:
-                # Fail open - allow the import if we can't determine
-                logger = self._get_logger()
-                if logger:
-                    logger.warning(f"DBX-Patch: Exception in patched __is_user_import: {e}")
-                return False
+                if warning_enabled:
+                    logger.warning("DBX-Patch: Exception in patched %s: %s", hook_name, e)
+                return error_result
+            finally:
+                # The walk starts at this very frame, so drop the reference to avoid a frame -> local -> frame cycle
+                del frame
 
         return patched_is_user_import
 
-    def _create_patched_is_user_import_modern(self, original_method: Callable[..., bool]) -> Callable[..., bool]:
-        """Create patched version for _WorkspacePathEntryFinder (DBR >= 18.0).
+    def _create_patched_is_user_import_legacy(self, original_method: Callable[..., bool]) -> Callable[..., bool]:
+        """Create patched version for WsfsImportHook (DBR < 18.0).
 
         Args:
-            original_method: The original _is_user_import method
+            original_method: The original __is_user_import method
 
         Returns:
             Patched method that includes editable path checking
         """
+        return self._create_patched_is_user_import(
+            original_method,
+            hook_name="WsfsImportHook.__is_user_import",
+            allow_list_attr="SITE_PACKAGE_WHITE_LIST",
+            site_packages_attr="_WsfsImportHook__site_packages",
+            max_depth_attr="_WsfsImportHook__max_recursion_depth",
+            error_result=False,
+        )
 
-        def patched_is_user_import(finder_self: Any) -> bool:
-            logger = self._get_logger()
-            if logger:
-                logger.debug("_WorkspacePathEntryFinder._is_user_import called (PATCHED)")
-
-            try:
-                frame = sys._getframe()
-                num_items_processed = 0
-
-                while frame is not None:
-                    if num_items_processed >= finder_self._max_stack_depth:
-                        return True
-
-                    filename = finder_self.get_filename(frame)
-
-                    # NEW: Allow imports from editable install paths FIRST
-                    if self._cached_editable_paths:
-                        is_editable_path = any(
-                            filename.startswith(editable_path) for editable_path in self._cached_editable_paths
-                        )
-                        if is_editable_path and logger:
-                            matching = [p for p in self._cached_editable_paths if filename.startswith(p)]
-                            logger.debug(
-                                f"_WorkspacePathEntryFinder: Allowing import from editable path: {filename} (matched: {matching[0] if matching else 'unknown'})"
-                            )
-                            return True
-
-                    # Check allow list (existing behavior)
-                    if any(allow_listed_item in filename for allow_listed_item in finder_self.SITE_PACKAGE_ALLOW_LIST):
-                        return True
-
-                    # Check if from site-packages (existing behavior)
-                    if any(filename.startswith(package) for package in finder_self._site_packages):
-                        return False
-
-                    num_items_processed += 1
-                    frame = frame.f_back
-
-                return True
+    def _create_patched_is_user_import_modern(self, original_method: Callable[..., bool]) -> Callable[..., bool]:
+        """Create patched version for _WorkspacePathEntryFinder (DBR >= 18.0).
 
-            except Exception as e:
-                logger = self._get_logger()
-                if logger:
-                    logger.warning(f"DBX-Patch: Exception in patched _is_user_import: {e}")
-                return True
+        Args:
+            original_method: The original _is_user_import method
 
-        return patched_is_user_import
+        Returns:
+            Patched method that includes editable path checking
+        """
+        return self._create_patched_is_user_import(
+            original_method,
+            hook_name="_WorkspacePathEntryFinder._is_user_import",
+            allow_list_attr="SITE_PACKAGE_ALLOW_LIST",
+            site_packages_attr="_site_packages",
+            max_depth_attr="_max_stack_depth",
+            error_result=True,
+        )
 
     def patch(self) -> PatchResult:
         """Apply the workspace import hook patch.
@@ -174,13 +348,13 @@ class WsfsImportHookPatch(BasePatch):
                 success=True,
                 already_patched=True,
                 editable_paths_count=len(self._cached_editable_paths),
-                editable_paths=sorted(self._cached_editable_paths),
+                editable_paths=list(self._sorted_editable_paths),
                 hook_found=True,
             )
 
         try:
             # Detect editable paths
-            self._cached_editable_paths = self._detect_editable_paths()
+            self._set_editable_paths(self._detect_editable_paths())
 
             # Determine which version to patch based on runtime version
             use_modern = is_runtime_version_gte(18, 0)
@@ -226,7 +400,7 @@ class WsfsImportHookPatch(BasePatch):
                         success=True,
                         already_patched=False,
                         editable_paths_count=len(self._cached_editable_paths),
-                        editable_paths=sorted(self._cached_editable_paths),
+                        editable_paths=list(self._sorted_editable_paths),
                         hook_found=True,
                     )
 
@@ -278,7 +452,7 @@ class WsfsImportHookPatch(BasePatch):
                         success=True,
                         already_patched=False,
                         editable_paths_count=len(self._cached_editable_paths),
-                        editable_paths=sorted(self._cached_editable_paths),
+                        editable_paths=list(self._sorted_editable_paths),
                         hook_found=True,
                     )
 
@@ -294,11 +468,10 @@ class WsfsImportHookPatch(BasePatch):
 
             if result.success:
                 self._is_applied = True
+                self._patched_modern = use_modern
                 if self._cached_editable_paths and logger:
                     with logger.indent():
-                        logger.info("Allowed editable paths:")
-                        for path in sorted(self._cached_editable_paths):
-                            logger.info(f"  - {path}")
+                        logger.bullets("Allowed editable paths:", self._sorted_editable_paths)
                 elif logger:
                     with logger.indent():
                         logger.warning("No editable install paths found yet.")
@@ -352,10 +525,8 @@ class WsfsImportHookPatch(BasePatch):
             return False
 
         try:
-            # Determine which version was patched based on runtime version
-            use_modern = is_runtime_version_gte(18, 0)
-
-            if use_modern:
+            # Restore the variant patch() replaced rather than re-probing the runtime version
+            if self._patched_modern:
                 # Restore modern _WorkspacePathEntryFinder (DBR >= 18.0)
                 try:
                     from dbruntime.workspace_import_machinery import (  # type: ignore[import-not-found]
@@ -10,8 +10,6 @@ These path finders are in sys.meta_path and prevent imports of notebook files.
 We verify they don't interfere with editable package imports.
 """
 
-from typing import Any
-
 from dbx_patch.base_patch import BaseVerification
 from dbx_patch.models import PatchResult
 from dbx_patch.utils.runtime_version import is_runtime_version_gte
@@ -23,15 +21,6 @@ class WsfsPathFinderVerification(BaseVerification):
     Verifies that workspace path finders don't interfere with editable imports.
     """
 
-    def __init__(self, verbose: bool = True) -> None:
-        """Initialize the verification.
-
-        Args:
-            verbose: Enable verbose logging
-        """
-        super().__init__(verbose)
-        self._original_find_spec: Any = None
-
     def verify(self) -> PatchResult:
         """Verify workspace path finder doesn't block editable imports.
 
@@ -66,9 +55,6 @@ class WsfsPathFinderVerification(BaseVerification):
                     if logger:
                         logger.info("Verifying modern _WorkspacePathFinder compatibility...")
 
-                    # Save original method (for potential future enhancements)
-                    self._original_find_spec = _WorkspacePathFinder.find_spec
-
                     if logger:
                         logger.success("Modern _WorkspacePathFinder verified - compatible with editable installs!")
                         with logger.indent():
@@ -98,9 +84,6 @@ class WsfsPathFinderVerification(BaseVerification):
                     if logger:
                         logger.info("Verifying legacy WsfsPathFinder compatibility...")
 
-                    # Save original method (for potential future enhancements)
-                    self._original_find_spec = WsfsPathFinder.find_spec
-
                     if logger:
                         logger.success("Legacy WsfsPathFinder verified - compatible with editable installs!")
                         with logger.indent():
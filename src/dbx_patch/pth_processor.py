@@ -11,42 +11,63 @@ Supports:
 """
 
 import contextlib
-import json
+import logging
 import os
 from pathlib import Path
 import sys
 from typing import Any
 
 from dbx_patch.models import PthProcessingResult
+from dbx_patch.utils.logger import get_enabled_logger
 
-# Module-level cached logger
-_logger: Any = None
+# Lines starting with these are executed rather than treated as paths; site.py accepts "import" followed by a tab too
+_PTH_IMPORT_PREFIXES = ("import ", "import\t", "__import__")
+
+# Site-packages directories found for the last sys.path contents seen
+_site_dirs_cache: tuple[tuple[str, ...], list[str]] | None = None
+
+# Meaningful lines read from each .pth file, keyed by the file's (mtime_ns, size) stat signature
+_pth_file_cache: dict[str, tuple[tuple[int, int], list[str]]] = {}
+
+# Editable project paths declared via importlib.metadata, keyed by the sys.path entries and their modification times
+_metadata_cache: tuple[tuple[tuple[str, int], ...], tuple[str, ...]] | None = None
 
 
 def _get_logger() -> Any:
-    """Get module-level cached logger instance."""
-    global _logger
-    if _logger is None:
-        with contextlib.suppress(Exception):
-            from dbx_patch.utils.logger import get_logger
+    """Get the default logger, or None if logging is disabled; resolved once per process."""
+    return get_enabled_logger()
 
-            _logger = get_logger()
-    return _logger
+
+def _clear_caches() -> None:
+    """Forget every cached scan, so the next call reads sys.path, all .pth files and metadata again."""
+    global _site_dirs_cache, _metadata_cache
+    _site_dirs_cache = None
+    _pth_file_cache.clear()
+    _metadata_cache = None
 
 
 def get_site_packages_dirs() -> list[str]:
     """Get all site-packages and dist-packages directories from sys.path.
 
+    The directories are only looked up again when the contents of sys.path change.
+
     Returns:
         List of absolute paths to site-packages directories that exist.
     """
+    global _site_dirs_cache
+    sys_path = tuple(sys.path)
+    if _site_dirs_cache is not None and _site_dirs_cache[0] == sys_path:
+        return list(_site_dirs_cache[1])
+
     site_dirs = []
-    for path in sys.path:
-        if isinstance(path, str) and ("site-packages" in path or "dist-packages" in path):
-            path_obj = Path(path)
-            if path_obj.exists() and path_obj.is_dir():
-                site_dirs.append(str(path_obj.resolve()))
-    return list(dict.fromkeys(site_dirs))  # Remove duplicates while preserving order
+    for path in sys_path:
+        # is_dir() is a single stat call and is already False for missing paths
+        if isinstance(path, str) and ("site-packages" in path or "dist-packages" in path) and Path(path).is_dir():
+            site_dirs.append(os.path.realpath(path))
+    site_dirs = list(dict.fromkeys(site_dirs))  # Remove duplicates while preserving order
+
+    _site_dirs_cache = (sys_path, site_dirs)
+    return list(site_dirs)
 
 
 def find_pth_files(site_packages_dir: str) -> list[str]:
@@ -60,11 +81,12 @@ def find_pth_files(site_packages_dir: str) -> list[str]:
     """
     pth_files = []
     try:
-        site_packages_path = Path(site_packages_dir)
-        for entry in site_packages_path.iterdir():
-            if entry.name.endswith(".pth") and entry.is_file():
-                pth_files.append(str(entry))
-    except (OSError, PermissionError) as e:
+        # DirEntry.is_file() answers from the directory listing, without a stat per entry
+        with os.scandir(site_packages_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".pth") and entry.is_file():
+                    pth_files.append(entry.path)
+    except OSError as e:
         logger = _get_logger()
         if logger:
             logger.warning(f"Could not scan {site_packages_dir}: {e}")
@@ -83,6 +105,11 @@ def process_pth_file(pth_file_path: str) -> list[str]:
     that register import hooks. We execute these statements to properly install
     the editable package.
 
+    Only the file's lines are cached, and only until its size or modification time
+    changes; see ``_read_pth_file``. Import statements are executed and directory
+    entries checked on every call, so a directory created after the first scan is
+    still found.
+
     Args:
         pth_file_path: Path to the .pth file
 
@@ -91,60 +118,103 @@ def process_pth_file(pth_file_path: str) -> list[str]:
     """
     logger = _get_logger()
     if logger:
-        logger.debug(f"Processing .pth file: {pth_file_path}")
+        logger.debug("Processing .pth file: %s", pth_file_path)
+
+    try:
+        stat = Path(pth_file_path).stat()
+    except OSError:
+        # Let _read_pth_file report the unreadable file
+        lines = _read_pth_file(pth_file_path)
+    else:
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _pth_file_cache.get(pth_file_path)
+        if cached is None or cached[0] != signature:
+            cached = (signature, _read_pth_file(pth_file_path))
+            _pth_file_cache[pth_file_path] = cached
+        lines = cached[1]
 
     paths = []
+    pth_path = Path(pth_file_path)
+    # Relative entries are resolved against the directory holding the .pth file
+    parent_dir = pth_path.parent
 
-    try:
-        with Path(pth_file_path).open(encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
+    for line in lines:
+        # Execute import statements (for PEP 660 editable installs)
+        if line.startswith(_PTH_IMPORT_PREFIXES):
+            try:
+                # Execute the import statement
+                # This typically installs a meta path finder for the editable package
+                if logger:
+                    logger.debug("Executing .pth import statement: %s", line)
+                # Using exec is necessary here to execute .pth file import hooks
+                # This is the standard behavior of Python's site.py
+                exec(line, {"__file__": pth_file_path, "__name__": "__sitecustomize__"})  # noqa: S102
+                if logger:
+                    logger.debug("Successfully executed import from %s", pth_path.name)
+            except Exception as e:
+                if logger:
+                    logger.warning(f"Failed to execute .pth import statement: {e}")
+            continue
+
+        # Check if it's a valid directory path; joining an absolute entry keeps it as is
+        entry_path = parent_dir / line
+
+        # is_dir() is a single stat call and is already False for missing paths;
+        # only valid entries are canonicalized
+        if entry_path.is_dir():
+            abs_path = os.path.realpath(entry_path)
+            paths.append(abs_path)
+            if logger:
+                logger.debug("Found editable path in .pth: %s", abs_path)
+        else:
+            if logger:
+                logger.debug("Skipping invalid path in .pth: %s (%s is not a directory)", line, entry_path)
 
-                # Skip empty lines and comments
-                if not line or line.startswith("#"):
-                    continue
+    if logger:
+        logger.debug("Total paths from %s: %d", pth_file_path, len(paths))
 
-                # Execute import statements (for PEP 660 editable installs)
-                if line.startswith("import ") or line.startswith("__import__"):
-                    try:
-                        # Execute the import statement
-                        # This typically installs a meta path finder for the editable package
-                        if logger:
-                            logger.debug(f"Executing .pth import statement: {line}")
-                        # Using exec is necessary here to execute .pth file import hooks
-                        # This is the standard behavior of Python's site.py
-                        exec(line, {"__file__": pth_file_path, "__name__": "__sitecustomize__"})  # noqa: S102
-                        if logger:
-                            logger.debug(f"Successfully executed import from {Path(pth_file_path).name}")
-                    except Exception as e:
-                        if logger:
-                            logger.warning(f"Failed to execute .pth import statement: {e}")
-                    continue
+    return paths
 
-                # Check if it's a valid directory path
-                line_path = Path(line)
-                if line_path.is_absolute():
-                    abs_path = line_path.resolve()
-                else:
-                    abs_path = (Path(pth_file_path).parent / line).resolve()
 
-                if abs_path.exists() and abs_path.is_dir():
-                    paths.append(str(abs_path))
-                    if logger:
-                        logger.debug(f"Found editable path in .pth: {abs_path}")
-                else:
-                    if logger:
-                        logger.debug(
-                            f"Skipping invalid path in .pth: {line} (resolved to {abs_path}, exists={abs_path.exists()}, is_dir={abs_path.is_dir() if abs_path.exists() else 'N/A'})"
-                        )
+def _read_pth_file(pth_file_path: str) -> list[str]:
+    """Read the lines of a single .pth file that are not blank or comments.
+
+    Args:
+        pth_file_path: Path to the .pth file
+
+    Returns:
+        Stripped directory entries and import statements, in file order
+    """
+    try:
+        # .pth files are small, so one read and split beats iterating the text stream line by line
+        text = Path(pth_file_path).read_text(encoding="utf-8")
     except (OSError, UnicodeDecodeError) as e:
+        logger = _get_logger()
         if logger:
             logger.warning(f"Could not process {pth_file_path}: {e}")
+        return []
 
-    if logger:
-        logger.debug(f"Total paths from {pth_file_path}: {len(paths)}")
+    # Skip empty lines and comments
+    return [line for line in map(str.strip, text.splitlines()) if line and not line.startswith("#")]
 
-    return paths
+
+def _read_egg_link(egg_link_path: str) -> str | None:
+    """Read the project directory from a single .egg-link file.
+
+    Args:
+        egg_link_path: Path to the .egg-link file
+
+    Returns:
+        Absolute path to the linked directory, or None if missing or invalid
+    """
+    try:
+        with Path(egg_link_path).open() as f:
+            path = f.readline().strip()
+    except OSError:
+        return None
+    if path and Path(path).is_dir():
+        return os.path.realpath(path)
+    return None
 
 
 def find_egg_link_paths(site_packages_dir: str) -> list[str]:
@@ -158,54 +228,141 @@ def find_egg_link_paths(site_packages_dir: str) -> list[str]:
     """
     paths = []
     try:
-        site_packages_path = Path(site_packages_dir)
-        for entry in site_packages_path.iterdir():
-            if entry.name.endswith(".egg-link"):
-                try:
-                    with entry.open() as f:
-                        path = f.readline().strip()
-                        if path:
-                            path_obj = Path(path)
-                            if path_obj.exists() and path_obj.is_dir():
-                                paths.append(str(path_obj.resolve()))
-                except OSError:
-                    pass
-    except (OSError, PermissionError):
+        with os.scandir(site_packages_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".egg-link"):
+                    path = _read_egg_link(entry.path)
+                    if path:
+                        paths.append(path)
+    except OSError:
         pass
     return paths
 
 
+def _scan_site_dir(site_packages_dir: str) -> tuple[list[str], list[str]]:
+    """Collect .pth and .egg-link files from a site-packages directory in one os.scandir pass.
+
+    Args:
+        site_packages_dir: Path to site-packages directory
+
+    Returns:
+        Tuple of (.pth file paths, .egg-link file paths)
+    """
+    pth_files: list[str] = []
+    egg_links: list[str] = []
+    try:
+        with os.scandir(site_packages_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.endswith(".pth"):
+                    files = pth_files
+                elif name.endswith(".egg-link"):
+                    files = egg_links
+                else:
+                    continue
+                if not entry.is_file():
+                    continue
+                files.append(entry.path)
+    except OSError as e:
+        logger = _get_logger()
+        if logger:
+            logger.warning(f"Could not scan {site_packages_dir}: {e}")
+    return pth_files, egg_links
+
+
+def _get_site_dir_editable_paths(site_packages_dir: str) -> set[str]:
+    """Get editable paths declared in one site-packages directory.
+
+    The directory is rescanned on every call, so entries whose target directory
+    appears later are still found; unchanged .pth files are not re-read, see
+    ``process_pth_file``.
+
+    Args:
+        site_packages_dir: Path to site-packages directory
+
+    Returns:
+        Set of absolute paths to editable install directories
+    """
+    pth_files, egg_links = _scan_site_dir(site_packages_dir)
+    paths: set[str] = set()
+    for pth_file in pth_files:
+        paths.update(process_pth_file(pth_file))
+    for egg_link in egg_links:
+        path = _read_egg_link(egg_link)
+        if path:
+            paths.add(path)
+    return paths
+
+
+def _sys_path_signature() -> tuple[tuple[str, int], ...]:
+    """Get the modification time of every existing sys.path entry.
+
+    Installing or removing a distribution adds or deletes its .dist-info directory,
+    which changes the modification time of the directory holding it.
+
+    Returns:
+        Tuple of (sys.path entry, mtime_ns) pairs
+    """
+    signature = []
+    for entry in sys.path:
+        if isinstance(entry, str):
+            with contextlib.suppress(OSError):
+                # An empty entry stands for the current directory
+                signature.append((entry, Path(entry or ".").stat().st_mtime_ns))
+    return tuple(signature)
+
+
 def detect_editable_installs_via_metadata() -> set[str]:
     """Detect editable installs via importlib.metadata (PEP 660 modern approach).
 
+    The installed distributions are only scanned again when sys.path or the
+    modification time of one of its directories changed since the previous call.
+    Whether each project directory exists is checked on every call, so a project
+    that appears later is still found.
+
     Returns:
         Set of absolute paths to editable install directories
     """
-    editable_paths = set()
+    global _metadata_cache
+    signature = _sys_path_signature()
+    if _metadata_cache is None or _metadata_cache[0] != signature:
+        _metadata_cache = (signature, _read_editable_metadata())
+    return {os.path.realpath(path) for path in _metadata_cache[1] if Path(path).exists()}
+
+
+def _read_editable_metadata() -> tuple[str, ...]:
+    """Read direct_url.json of every installed distribution and collect editable project paths.
+
+    Returns:
+        Project paths declared by editable installs, whether or not they exist
+    """
+    editable_paths = []
 
     try:
+        # Only needed here, so json and importlib.metadata stay off the package import path
         from importlib.metadata import distributions
+        import json
+        from urllib.parse import unquote
 
         for dist in distributions():
             try:
                 # Check for direct_url.json (PEP 660 and modern pip)
                 if hasattr(dist, "read_text"):
                     direct_url_text = dist.read_text("direct_url.json")
-                    if direct_url_text:
+                    # Most distributions are not editable; skip parsing JSON that cannot contain the flag
+                    if direct_url_text and '"editable"' in direct_url_text:
                         direct_url = json.loads(direct_url_text)
                         if direct_url.get("dir_info", {}).get("editable"):
                             url = direct_url.get("url", "")
                             if url.startswith("file://"):
-                                path = url[7:]  # Remove 'file://'
-                                path_obj = Path(path)
-                                if path_obj.exists():
-                                    editable_paths.add(str(path_obj.resolve()))
+                                # pip percent-encodes the project path, e.g. spaces as %20
+                                editable_paths.append(unquote(url.removeprefix("file://")))
             except (FileNotFoundError, json.JSONDecodeError, AttributeError):
                 continue
     except ImportError:
         pass
 
-    return editable_paths
+    return tuple(dict.fromkeys(editable_paths))
 
 
 def add_paths_to_sys_path(paths: list[str], prepend: bool = False) -> int:
@@ -220,7 +377,7 @@ def add_paths_to_sys_path(paths: list[str], prepend: bool = False) -> int:
     """
     logger = _get_logger()
     if logger:
-        logger.debug(f"Adding {len(paths)} path(s) to sys.path (prepend={prepend})")
+        logger.debug("Adding %d path(s) to sys.path (prepend=%s)", len(paths), prepend)
 
     added_count = 0
     existing_paths = set(sys.path)
@@ -231,12 +388,14 @@ def add_paths_to_sys_path(paths: list[str], prepend: bool = False) -> int:
                 sys.path.insert(0, path)
             else:
                 sys.path.append(path)
+            # Track additions too, so a path repeated in the input is only added once
+            existing_paths.add(path)
             added_count += 1
             if logger:
-                logger.debug(f"Added to sys.path: {path}")
+                logger.debug("Added to sys.path: %s", path)
         else:
             if logger:
-                logger.debug(f"Already in sys.path: {path}")
+                logger.debug("Already in sys.path: %s", path)
 
     return added_count
 
@@ -247,11 +406,15 @@ def process_all_pth_files(force: bool = False) -> PthProcessingResult:
     This is the main entry point for fixing editable install imports.
 
     Args:
-        force: If True, re-add paths even if they're already in sys.path
+        force: If True, re-read every .pth file and re-add paths even if they're already in sys.path
 
     Returns:
         PthProcessingResult with processing details
     """
+    if force:
+        # Catches rewrites the stat signatures cannot see, e.g. same-size edits within the mtime granularity
+        _clear_caches()
+
     site_dirs = get_site_packages_dirs()
     all_paths = []
     pth_files_count = 0
@@ -260,21 +423,24 @@ def process_all_pth_files(force: bool = False) -> PthProcessingResult:
 
     if logger:
         logger.info(f"Scanning {len(site_dirs)} site-packages directories for editable installs...")
+    # Resolve the INFO gate once, so the per-file report below costs nothing when it is filtered out
+    report_files = logger is not None and logger.is_enabled_for(logging.INFO)
 
     # Process .pth files
     for site_dir in site_dirs:
-        pth_files = find_pth_files(site_dir)
+        # One directory pass collects both .pth and .egg-link files
+        pth_files, egg_links = _scan_site_dir(site_dir)
         pth_files_count += len(pth_files)
 
         for pth_file in pth_files:
             paths = process_pth_file(pth_file)
             all_paths.extend(paths)
-            if paths and logger:
+            if paths and report_files:
                 with logger.indent():
-                    logger.info(f"Found {len(paths)} path(s) in {Path(pth_file).name}")
+                    logger.info("Found %d path(s) in %s", len(paths), Path(pth_file).name)
 
         # Also check for .egg-link files
-        egg_paths = find_egg_link_paths(site_dir)
+        egg_paths = [path for path in map(_read_egg_link, egg_links) if path]
         egg_link_paths.extend(egg_paths)
         all_paths.extend(egg_paths)
 
@@ -287,10 +453,9 @@ def process_all_pth_files(force: bool = False) -> PthProcessingResult:
 
     # Add to sys.path
     if force:
-        # Remove existing paths first
-        for path in unique_paths:
-            while path in sys.path:
-                sys.path.remove(path)
+        # Remove existing paths first, in one pass; slice assignment keeps the sys.path list object
+        drop = set(unique_paths)
+        sys.path[:] = [path for path in sys.path if path not in drop]
 
     paths_added = add_paths_to_sys_path(unique_paths, prepend=False)
 
@@ -306,10 +471,7 @@ def process_all_pth_files(force: bool = False) -> PthProcessingResult:
 
     if unique_paths and logger:
         logger.blank()
-        logger.info("Editable install paths:")
-        with logger.indent():
-            for path in unique_paths:
-                logger.info(f"- {path}")
+        logger.bullets("Editable install paths:", unique_paths)
 
     return PthProcessingResult(
         site_dirs_scanned=len(site_dirs),
@@ -334,18 +496,17 @@ def get_editable_install_paths() -> set[str]:
 
     all_paths = set()
 
-    # From .pth files
+    # From .pth and .egg-link files
     for site_dir in get_site_packages_dirs():
-        for pth_file in find_pth_files(site_dir):
-            all_paths.update(process_pth_file(pth_file))
-        all_paths.update(find_egg_link_paths(site_dir))
+        all_paths.update(_get_site_dir_editable_paths(site_dir))
 
     # From metadata
     all_paths.update(detect_editable_installs_via_metadata())
 
-    if logger:
-        logger.debug(f"get_editable_install_paths() returning {len(all_paths)} path(s)")
+    # Sorting the paths for the listing is only worth it when DEBUG output is on
+    if logger and logger.is_enabled_for(logging.DEBUG):
+        logger.debug("get_editable_install_paths() returning %d path(s)", len(all_paths))
         for path in sorted(all_paths):
-            logger.debug(f"  - {path}")
+            logger.debug("  - %s", path)
 
     return all_paths
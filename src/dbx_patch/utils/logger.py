@@ -3,14 +3,17 @@
 Provides structured logging with context managers for separator formatting.
 """
 
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
 import contextlib
-from contextlib import contextmanager
+from contextlib import AbstractContextManager, contextmanager
 import logging
 import os
 import sys
 from typing import Any, Self
 
+# Level names accepted in DBX_PATCH_LOG_LEVEL; unlike getattr(logging, ...), other module attributes are rejected
+_LOG_LEVELS = logging.getLevelNamesMapping()
+
 
 class PatchLogger:
     """Logger for DBX-Patch operations with context manager support for sections.
@@ -34,72 +37,87 @@ class PatchLogger:
         self._logger = logging.getLogger(name)
 
         # Check if logging is enabled
-        self._enabled = os.environ.get("DBX_PATCH_ENABLED", "").lower() in ("1", "true", "yes")
+        self._enabled = os.environ.get("DBX_PATCH_ENABLED", "").lower() in {"1", "true", "yes"}
 
         # Set log level from env vars
         # DBX_PATCH_LOG_LEVEL sets the level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         level_name = os.environ.get("DBX_PATCH_LOG_LEVEL", "ERROR").upper()
-        level = getattr(logging, level_name, logging.ERROR)
+        level = _LOG_LEVELS.get(level_name, logging.ERROR)
 
         self._logger.setLevel(level)
 
         # Setup handlers if enabled
         if self._enabled:
-            # Clear any existing handlers
+            # Replace handlers left by an earlier instance with a single console handler;
+            # the logger level above already filters records, so the handler keeps NOTSET
             self._logger.handlers.clear()
-
-            # Add console handler
-            handler = logging.StreamHandler(sys.stdout)
-            handler.setLevel(level)
-
-            if self._logger.hasHandlers():
-                self._logger.handlers.clear()
-
-            self._logger.addHandler(handler)
+            self._logger.addHandler(logging.StreamHandler(sys.stdout))
 
             # Prevent propagation to root logger to avoid duplicate messages
             self._logger.propagate = False
 
         self._indent_level = 0
         self._indent_char = "  "
+        # Current indent string, rebuilt only when the indent level changes
+        self._indent = ""
+        # Returned by section() and subsection() while INFO output is off; nullcontext is reusable
+        self._null_context: AbstractContextManager[Self] = contextlib.nullcontext(self)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether output was switched on via DBX_PATCH_ENABLED."""
+        return self._enabled
+
+    def is_enabled_for(self, level: int) -> bool:
+        """Check whether a message at the given level would be emitted.
+
+        Args:
+            level: Logging level
+
+        Returns:
+            True if logging is enabled and the level passes the logger threshold
+        """
+        return self._enabled and self._logger.isEnabledFor(level)
 
-    def _log_with_indent(self, level: int, message: str) -> None:
+    def _log_with_indent(self, level: int, message: str, *args: Any, prefix: str = "") -> None:
         """Log a message with indentation if logging is enabled.
 
         Args:
             level: Logging level
-            message: Message to log
+            message: Message to log, may contain %-style placeholders
+            *args: Arguments merged into message only if the record is emitted
+            prefix: Marker such as "[DEBUG] ", only joined to the message if the record is emitted
         """
         if self._enabled and self._logger.isEnabledFor(level):
-            indent = self._indent_char * self._indent_level
-            self._logger.log(level, f"{indent}{message}")
+            self._logger.log(level, f"{self._indent}{prefix}{message}", *args)
 
     def info(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log an info message."""
-        self._log_with_indent(logging.INFO, message)
+        self._log_with_indent(logging.INFO, message, *args)
 
     def success(self, message: str) -> None:
         """Log a success message."""
-        self._log_with_indent(logging.INFO, f"[SUCCESS] {message}")
+        self._log_with_indent(logging.INFO, message, prefix="[SUCCESS] ")
 
     def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log a warning message."""
-        self._log_with_indent(logging.WARNING, f"[WARNING] {message}")
+        self._log_with_indent(logging.WARNING, message, *args, prefix="[WARNING] ")
 
     def error(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log an error message."""
-        self._log_with_indent(logging.ERROR, f"[ERROR] {message}")
+        self._log_with_indent(logging.ERROR, message, *args, prefix="[ERROR] ")
 
     def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log a debug message."""
-        self._log_with_indent(logging.DEBUG, f"[DEBUG] {message}")
+        self._log_with_indent(logging.DEBUG, message, *args, prefix="[DEBUG] ")
 
     def separator(self, char: str = "-", length: int = 70) -> None:
         """Print a separator line."""
-        self._log_with_indent(logging.INFO, char * length)
+        # The line is only built when it will be emitted
+        if self._enabled and self._logger.isEnabledFor(logging.INFO):
+            self._log_with_indent(logging.INFO, char * length)
 
-    @contextmanager
-    def section(self, title: str, char: str = "=", length: int = 70) -> Generator[Self, Any, None]:
+    def section(self, title: str, char: str = "=", length: int = 70) -> AbstractContextManager[Self]:
         """Context manager for a section with separator formatting.
 
         Usage:
@@ -110,20 +128,16 @@ class PatchLogger:
             title: Section title
             char: Character for separators
             length: Length of separator line
-        """
-        if self._enabled and self._logger.isEnabledFor(logging.INFO):
-            self._log_with_indent(logging.INFO, char * length)
-            self._log_with_indent(logging.INFO, title)
-            self._log_with_indent(logging.INFO, char * length)
 
-        try:
-            yield self
-        finally:
-            if self._enabled and self._logger.isEnabledFor(logging.INFO):
-                self._log_with_indent(logging.INFO, "")  # Blank line after section
+        Returns:
+            Context manager yielding this logger; a shared no-op one when INFO output is off
+        """
+        if not (self._enabled and self._logger.isEnabledFor(logging.INFO)):
+            return self._null_context
+        separator = char * length
+        return self._titled_block(separator, title, separator)
 
-    @contextmanager
-    def subsection(self, title: str, char: str = "-", length: int = 70) -> Generator[Self, Any, None]:
+    def subsection(self, title: str, char: str = "-", length: int = 70) -> AbstractContextManager[Self]:
         """Context manager for a subsection with separator formatting.
 
         Usage:
@@ -134,19 +148,29 @@ class PatchLogger:
             title: Subsection title
             char: Character for separators
             length: Length of separator line
+
+        Returns:
+            Context manager yielding this logger; a shared no-op one when INFO output is off
         """
-        if self._enabled and self._logger.isEnabledFor(logging.INFO):
-            self._log_with_indent(logging.INFO, title)
-            self._log_with_indent(logging.INFO, char * length)
+        if not (self._enabled and self._logger.isEnabledFor(logging.INFO)):
+            return self._null_context
+        return self._titled_block(title, char * length)
+
+    @contextmanager
+    def _titled_block(self, *header: str) -> Generator[Self, Any, None]:
+        """Log the header lines, then a blank line once the block exits.
 
+        Args:
+            *header: Lines logged on entry
+        """
+        for line in header:
+            self._log_with_indent(logging.INFO, line)
         try:
             yield self
         finally:
-            if self._enabled and self._logger.isEnabledFor(logging.INFO):
-                self._log_with_indent(logging.INFO, "")  # Blank line after subsection
+            self._log_with_indent(logging.INFO, "")  # Blank line after the block
 
-    @contextmanager
-    def indent(self, levels: int = 1) -> Generator[Self, Any, None]:
+    def indent(self, levels: int = 1) -> AbstractContextManager[Self]:
         """Context manager to indent output.
 
         Usage:
@@ -155,22 +179,73 @@ class PatchLogger:
 
         Args:
             levels: Number of indentation levels to add
+
+        Returns:
+            Context manager yielding this logger; a shared no-op one when logging is disabled
+        """
+        if not self._enabled:
+            return self._null_context
+        return _Indent(self, levels)
+
+    def _shift_indent(self, levels: int) -> None:
+        """Change the indentation level and rebuild the cached indent string.
+
+        Args:
+            levels: Number of levels to add, negative to remove
         """
         self._indent_level += levels
-        try:
-            yield self
-        finally:
-            self._indent_level -= levels
+        self._indent = self._indent_char * self._indent_level
+
+    def bullets(self, title: str, items: Iterable[str]) -> None:
+        """Log a title followed by one indented bullet line per item.
+
+        The list is emitted as a single record, so handlers run once however many
+        items there are, and nothing is formatted when INFO is filtered out.
+
+        Args:
+            title: Line introducing the list
+            items: Entries to list below the title
+        """
+        if self._enabled and self._logger.isEnabledFor(logging.INFO):
+            indent = self._indent
+            item_prefix = f"\n{indent}{self._indent_char}- "
+            self._logger.info(f"{indent}{title}" + "".join(f"{item_prefix}{item}" for item in items))
 
     def blank(self, count: int = 1) -> None:
-        """Print blank lines."""
-        for _ in range(count):
-            self._log_with_indent(logging.INFO, "")
+        """Print blank lines, emitted as a single record."""
+        if count > 0 and self._enabled and self._logger.isEnabledFor(logging.INFO):
+            # Unindented, so blank lines carry no trailing whitespace; the handler adds the last newline
+            self._logger.info("\n" * (count - 1))
+
+
+class _Indent:
+    """Context manager returned by PatchLogger.indent().
+
+    A plain class rather than a @contextmanager generator, as indent() wraps most log calls.
+    """
+
+    __slots__ = ("_levels", "_logger")
+
+    def __init__(self, logger: PatchLogger, levels: int) -> None:
+        self._logger = logger
+        self._levels = levels
+
+    def __enter__(self) -> PatchLogger:
+        self._logger._shift_indent(self._levels)
+        return self._logger
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._logger._shift_indent(-self._levels)
 
 
 # Global default logger instance
 _default_logger: PatchLogger | None = None
 
+# The default logger as handed to patch code: the instance, or None while it is disabled.
+# Resolved once; set_logger() and reset_logger() return it to _UNRESOLVED.
+_UNRESOLVED: Any = object()
+_enabled_logger: Any = _UNRESOLVED
+
 
 def get_logger() -> PatchLogger:
     """Get the default logger instance, creating it if necessary.
@@ -184,17 +259,35 @@ def get_logger() -> PatchLogger:
     return _default_logger
 
 
+def get_enabled_logger() -> PatchLogger | None:
+    """Get the default logger if its output is enabled.
+
+    The answer is resolved once and reused until set_logger() or reset_logger()
+    swaps the default logger, so disabled-mode callers pay a single global check.
+
+    Returns:
+        PatchLogger instance, or None if logging is disabled
+    """
+    global _enabled_logger
+    if _enabled_logger is _UNRESOLVED:
+        logger = get_logger()
+        _enabled_logger = logger if logger.enabled else None
+    return _enabled_logger
+
+
 def set_logger(logger: PatchLogger) -> None:
     """Set the default logger instance.
 
     Args:
         logger: Logger instance to use as default
     """
-    global _default_logger
+    global _default_logger, _enabled_logger
     _default_logger = logger
+    _enabled_logger = _UNRESOLVED
 
 
 def reset_logger() -> None:
     """Reset the default logger instance."""
-    global _default_logger
+    global _default_logger, _enabled_logger
     _default_logger = None
+    _enabled_logger = _UNRESOLVED
@@ -3,10 +3,14 @@
 This module provides utilities to detect and compare Databricks runtime versions.
 """
 
+from functools import lru_cache
 import os
 import re
 from typing import Any
 
+# Leading "major.minor" of a runtime version string such as "18.0" or "14.3 LTS"
+_VERSION_PATTERN = re.compile(r"(\d+)\.(\d+)")
+
 
 def get_runtime_version() -> str | None:
     """Get the Databricks runtime version from environment variable.
@@ -17,9 +21,12 @@ def get_runtime_version() -> str | None:
     return os.environ.get("DATABRICKS_RUNTIME_VERSION")
 
 
+@lru_cache(maxsize=8)
 def parse_version(version: str | None) -> tuple[int, int] | None:
     """Parse a version string into major and minor components.
 
+    Results are memoized per version string, so repeated runtime checks skip the regex.
+
     Args:
         version: Version string like "18.0", "14.3", or "15.4 LTS"
 
@@ -37,8 +44,7 @@ def parse_version(version: str | None) -> tuple[int, int] | None:
     if not version:
         return None
 
-    # Extract major.minor from strings like "18.0" or "14.3 LTS"
-    match = re.match(r"(\d+)\.(\d+)", version)
+    match = _VERSION_PATTERN.match(version)
     if not match:
         return None
 
@@ -67,14 +73,8 @@ def is_runtime_version_gte(target_major: int, target_minor: int = 0) -> bool:
         # This allows local development/testing to use new code paths
         return True
 
-    current_major, current_minor = current
-
-    if current_major > target_major:
-        return True
-    elif current_major == target_major:
-        return current_minor >= target_minor
-    else:
-        return False
+    # Tuples compare element by element, major first
+    return current >= (target_major, target_minor)
 
 
 def get_runtime_version_info() -> dict[str, Any]:
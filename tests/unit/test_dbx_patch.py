@@ -4,7 +4,7 @@ Run with: python -m pytest test_dbx_patch.py
 Or: python test_dbx_patch.py
 """
 
-from collections.abc import Generator
+from collections.abc import Iterator
 from pathlib import Path
 import sys
 import tempfile
@@ -23,12 +23,47 @@ def temp_site_packages(tmp_path: Path) -> Path:
 
 
 @pytest.fixture
-def mock_sys_path(temp_site_packages: Path) -> Generator[None, Any, None]:
-    """Mock sys.path with temporary site-packages."""
-    original_path = sys.path.copy()
-    sys.path.insert(0, str(temp_site_packages))
-    yield
-    sys.path = original_path
+def mock_sys_path(temp_site_packages: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Mock sys.path with temporary site-packages, restored in place by monkeypatch."""
+    monkeypatch.syspath_prepend(str(temp_site_packages))
+
+
+@pytest.fixture
+def wsfs_patch() -> Iterator[Any]:
+    """Yield a fresh WsfsImportHookPatch singleton, reset again afterwards."""
+    from dbx_patch.patches.wsfs_import_hook_patch import WsfsImportHookPatch
+
+    WsfsImportHookPatch.reset()
+    try:
+        yield WsfsImportHookPatch()
+    finally:
+        WsfsImportHookPatch.reset()
+
+
+def _hook_double(
+    site_packages: list[str],
+    allow_list: list[str] | None = None,
+    *,
+    legacy: bool = False,
+    get_filename: Any = None,
+) -> Any:
+    """Build a stand-in for the runtime's import hook, with either variant's attribute names."""
+    from types import SimpleNamespace
+
+    filename_of = get_filename or (lambda frame: frame.f_code.co_filename)
+    if legacy:
+        return SimpleNamespace(
+            _WsfsImportHook__max_recursion_depth=100,
+            SITE_PACKAGE_WHITE_LIST=allow_list or [],
+            _WsfsImportHook__site_packages=site_packages,
+            get_filename=filename_of,
+        )
+    return SimpleNamespace(
+        _max_stack_depth=100,
+        SITE_PACKAGE_ALLOW_LIST=allow_list or [],
+        _site_packages=site_packages,
+        get_filename=filename_of,
+    )
 
 
 # Test pth_processor module
@@ -40,6 +75,23 @@ class TestPthProcessor:
         site_dirs = get_site_packages_dirs()
         assert str(temp_site_packages) in site_dirs
 
+    def test_get_site_packages_dirs_cached_until_sys_path_changes(
+        self, temp_site_packages: Path, tmp_path: Path, mock_sys_path: None, mocker: Any
+    ) -> None:
+        """Test that site-packages directories are only re-checked after sys.path changes."""
+        from dbx_patch.pth_processor import get_site_packages_dirs
+
+        first = get_site_packages_dirs()
+        isdir = mocker.spy(Path, "is_dir")
+        assert get_site_packages_dirs() == first
+        assert isdir.call_count == 0
+
+        other = tmp_path / "other" / "site-packages"
+        other.mkdir(parents=True)
+        sys.path.append(str(other))
+        assert str(other) in get_site_packages_dirs()
+        assert isdir.call_count > 0
+
     def test_find_pth_files(self, temp_site_packages: Path) -> None:
         """Test finding .pth files in a directory."""
         from dbx_patch.pth_processor import find_pth_files
@@ -78,6 +130,27 @@ class TestPthProcessor:
         paths = process_pth_file(str(pth_file))
         assert len(paths) == 0
 
+    def test_process_pth_file_executes_tab_separated_import(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that "import" followed by a tab is executed, as site.py does."""
+        import os
+
+        # Registered with monkeypatch so the value set by the .pth line is removed afterwards
+        monkeypatch.setenv("DBX_PATCH_PTH_TAB_IMPORT", "0")
+        from dbx_patch.pth_processor import process_pth_file
+
+        pth_file = tmp_path / "tab.pth"
+        pth_file.write_text("import\tos; os.environ['DBX_PATCH_PTH_TAB_IMPORT'] = '1'\n")
+
+        assert process_pth_file(str(pth_file)) == []
+        assert os.environ.get("DBX_PATCH_PTH_TAB_IMPORT") == "1"
+
+        # Import lines are executed again even when the file's lines come from the cache
+        monkeypatch.setenv("DBX_PATCH_PTH_TAB_IMPORT", "0")
+        assert process_pth_file(str(pth_file)) == []
+        assert os.environ.get("DBX_PATCH_PTH_TAB_IMPORT") == "1"
+
     def test_process_pth_file_skip_comments(self, tmp_path: Path) -> None:
         """Test that comments are skipped."""
         from dbx_patch.pth_processor import process_pth_file
@@ -92,6 +165,39 @@ class TestPthProcessor:
         assert len(paths) == 1
         assert paths[0] == str(test_dir)
 
+    def test_process_pth_file_reuses_unchanged_file(self, tmp_path: Path, mocker: Any) -> None:
+        """Test that a .pth file is only re-read after its contents change."""
+        from dbx_patch import pth_processor
+
+        first_dir = tmp_path / "first"
+        first_dir.mkdir()
+        second_dir = tmp_path / "second_package"
+        second_dir.mkdir()
+        pth_file = tmp_path / "cached.pth"
+        pth_file.write_text(f"{first_dir}\n")
+
+        read_pth_file = mocker.spy(pth_processor, "_read_pth_file")
+        assert pth_processor.process_pth_file(str(pth_file)) == [str(first_dir)]
+        assert pth_processor.process_pth_file(str(pth_file)) == [str(first_dir)]
+        assert read_pth_file.call_count == 1
+
+        # A different size changes the stat signature even within the mtime granularity
+        pth_file.write_text(f"{second_dir}\n")
+        assert pth_processor.process_pth_file(str(pth_file)) == [str(second_dir)]
+        assert read_pth_file.call_count == 2
+
+    def test_process_pth_file_finds_late_created_directory(self, tmp_path: Path) -> None:
+        """Test that a directory listed before it exists is found once it is created."""
+        from dbx_patch.pth_processor import process_pth_file
+
+        late_dir = tmp_path / "late_package"
+        pth_file = tmp_path / "late.pth"
+        pth_file.write_text(f"{late_dir}\n")
+
+        assert process_pth_file(str(pth_file)) == []
+        late_dir.mkdir()
+        assert process_pth_file(str(pth_file)) == [str(late_dir)]
+
     def test_find_egg_link_paths(self, temp_site_packages: Path, tmp_path: Path) -> None:
         """Test finding paths from .egg-link files."""
         from dbx_patch.pth_processor import find_egg_link_paths
@@ -108,6 +214,79 @@ class TestPthProcessor:
         assert len(paths) == 1
         assert paths[0] == str(test_pkg)
 
+    def test_get_editable_install_paths_reuses_unchanged_pth_files(
+        self, temp_site_packages: Path, tmp_path: Path, mock_sys_path: None, mocker: Any
+    ) -> None:
+        """Test that site-packages directories are rescanned but unchanged .pth files are not re-read."""
+        from dbx_patch import pth_processor
+
+        pkg_a = tmp_path / "pkg_a"
+        pkg_a.mkdir()
+        pkg_b = tmp_path / "pkg_b"
+        pkg_b.mkdir()
+        (temp_site_packages / "a.pth").write_text(f"{pkg_a}\n")
+
+        spy = mocker.spy(pth_processor, "_read_pth_file")
+        assert str(pkg_a) in pth_processor.get_editable_install_paths()
+        calls = spy.call_count
+        assert calls >= 1
+
+        # Unchanged .pth files: served from the cache
+        assert str(pkg_a) in pth_processor.get_editable_install_paths()
+        assert spy.call_count == calls
+
+        # New .pth file: found by the rescan and read once
+        (temp_site_packages / "b.pth").write_text(f"{pkg_b}\n")
+        assert str(pkg_b) in pth_processor.get_editable_install_paths()
+        assert spy.call_count == calls + 1
+
+    def test_detect_editable_installs_via_metadata_cached_until_install(
+        self, temp_site_packages: Path, mock_sys_path: None, mocker: Any
+    ) -> None:
+        """Test that distributions are only rescanned after a sys.path directory changes."""
+        import os
+
+        from dbx_patch import pth_processor
+
+        read_metadata = mocker.spy(pth_processor, "_read_editable_metadata")
+        first = pth_processor.detect_editable_installs_via_metadata()
+        assert pth_processor.detect_editable_installs_via_metadata() == first
+        assert read_metadata.call_count == 1
+
+        (temp_site_packages / "new_pkg-1.0.dist-info").mkdir()
+        # Guard against coarse filesystem timestamps leaving mtime unchanged
+        stat = temp_site_packages.stat()
+        os.utime(temp_site_packages, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        pth_processor.detect_editable_installs_via_metadata()
+        assert read_metadata.call_count == 2
+
+        # force=True rescans even though nothing changed
+        pth_processor.process_all_pth_files(force=True)
+        assert read_metadata.call_count == 3
+
+    def test_detect_editable_installs_via_metadata_decodes_file_urls(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mocker: Any
+    ) -> None:
+        """Test that percent-encoded editable project URLs are decoded and others are ignored."""
+        import importlib.metadata
+        import json
+
+        from dbx_patch import pth_processor
+
+        project = tmp_path / "my project"
+        editable = mocker.Mock()
+        editable.read_text.return_value = json.dumps({"url": project.as_uri(), "dir_info": {"editable": True}})
+        regular = mocker.Mock()
+        regular.read_text.return_value = json.dumps({"url": "https://example.com/pkg.whl", "archive_info": {}})
+
+        monkeypatch.setattr(importlib.metadata, "distributions", lambda: [editable, regular])
+        monkeypatch.setattr(pth_processor, "_metadata_cache", None)
+
+        # A project directory that appears after the scan is found without rescanning
+        assert pth_processor.detect_editable_installs_via_metadata() == set()
+        project.mkdir()
+        assert pth_processor.detect_editable_installs_via_metadata() == {str(project)}
+
     def test_add_paths_to_sys_path(self) -> None:
         """Test adding paths to sys.path."""
         from dbx_patch.pth_processor import add_paths_to_sys_path
@@ -126,9 +305,58 @@ class TestPthProcessor:
         added = add_paths_to_sys_path([test_path], prepend=False)
         assert added == 0
 
+        # Duplicates within one call are only added once
+        sys.path.remove(test_path)
+        added = add_paths_to_sys_path([test_path, test_path], prepend=True)
+        assert added == 1
+        assert sys.path.count(test_path) == 1
+
         # Cleanup
         sys.path.remove(test_path)
 
+    def test_process_all_pth_files_force_moves_paths_to_end(
+        self, temp_site_packages: Path, tmp_path: Path, mock_sys_path: None
+    ) -> None:
+        """Test that force=True drops every existing copy of a path before re-adding it."""
+        from dbx_patch.pth_processor import process_all_pth_files
+
+        pkg = tmp_path / "forced_pkg"
+        pkg.mkdir()
+        (temp_site_packages / "forced.pth").write_text(f"{pkg}\n")
+        sys.path.insert(0, str(pkg))
+        sys.path.insert(0, str(pkg))
+        path_list = sys.path
+
+        result = process_all_pth_files(force=True)
+
+        assert sys.path is path_list
+        assert sys.path.count(str(pkg)) == 1
+        assert sys.path.index(str(pkg)) > sys.path.index(str(temp_site_packages))
+        assert result.paths_added >= 1
+
+    def test_process_all_pth_files_force_rereads_pth_files(
+        self, temp_site_packages: Path, tmp_path: Path, mock_sys_path: None
+    ) -> None:
+        """Test that force=True re-reads a .pth file whose stat signature did not change."""
+        import os
+
+        from dbx_patch.pth_processor import process_all_pth_files
+
+        first = tmp_path / "pkg1"
+        first.mkdir()
+        second = tmp_path / "pkg2"
+        second.mkdir()
+        pth_file = temp_site_packages / "same_size.pth"
+        pth_file.write_text(f"{first}\n")
+        stat = pth_file.stat()
+        assert str(first) in process_all_pth_files().paths_extracted
+
+        # A same-size rewrite within the mtime granularity keeps the old signature
+        pth_file.write_text(f"{second}\n")
+        os.utime(pth_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert str(second) not in process_all_pth_files().paths_extracted
+        assert str(second) in process_all_pth_files(force=True).paths_extracted
+
 
 class TestWsfsImportHookPatch:
     def test_patch_detection_without_dbruntime(self) -> None:
@@ -154,7 +382,169 @@ class TestWsfsImportHookPatch:
         from dbx_patch.patches.wsfs_import_hook_patch import WsfsImportHookPatch
 
         paths = WsfsImportHookPatch().get_editable_paths()
-        assert isinstance(paths, set)
+        assert isinstance(paths, frozenset)
+
+    def test_patch_result_does_not_alias_cached_paths(self, wsfs_patch: Any) -> None:
+        """Test that mutating a returned PatchResult leaves the cached sorted paths intact."""
+        wsfs_patch._set_editable_paths({"/repo/b", "/repo/a"})
+        wsfs_patch._is_applied = True
+
+        result = wsfs_patch.patch()
+        assert result.already_patched
+        assert result.editable_paths == ["/repo/a", "/repo/b"]
+
+        result.editable_paths.append("/repo/c")
+        assert wsfs_patch._sorted_editable_paths == ("/repo/a", "/repo/b")
+
+    def test_compile_prefixes_drops_nested_paths(self) -> None:
+        """Test that nested editable paths are folded into their parent prefix."""
+        from dbx_patch.patches.wsfs_import_hook_patch import _compile_prefixes
+
+        prefixes = _compile_prefixes({"/repo/b", "/repo/a/sub", "/repo/a/", "/repo/a", "/repo/ab", "/other"})
+        assert prefixes == ("/other/", "/repo/a/", "/repo/ab/", "/repo/b/")
+
+    @pytest.mark.parametrize(
+        ("filename", "expected"),
+        [
+            ("/repo/a/sub/mod.py", "/repo/a/"),
+            ("/repo/a/mod.py", "/repo/a/"),
+            ("/repo/b/mod.py", "/repo/b/"),
+            ("/repo/bb/mod.py", None),
+            ("/repo/c/mod.py", None),
+            ("/aaa/mod.py", None),
+        ],
+    )
+    def test_match_prefix(self, filename: str, expected: str | None) -> None:
+        """Test binary-search prefix matching against compiled editable paths."""
+        from dbx_patch.patches.wsfs_import_hook_patch import _compile_prefixes, _match_prefix
+
+        prefixes = _compile_prefixes({"/repo/b", "/repo/a/sub", "/repo/a", "/other"})
+        assert _match_prefix(prefixes, filename) == expected
+
+    @pytest.mark.parametrize("count", [3, 100])
+    def test_has_prefix_small_and_large(self, count: int) -> None:
+        """Test that linear and binary-search matching agree on either side of the threshold."""
+        from dbx_patch.patches.wsfs_import_hook_patch import _compile_prefixes, _has_prefix
+
+        prefixes = _compile_prefixes({f"/repo/p{i:03d}" for i in range(count)})
+        assert _has_prefix(prefixes, f"/repo/p{count - 1:03d}/mod.py")
+        assert _has_prefix(prefixes, "/repo/p000/mod.py")
+        assert not _has_prefix(prefixes, "/repo/q/mod.py")
+        assert not _has_prefix(prefixes, "/aaa/mod.py")
+
+    @pytest.mark.parametrize(
+        ("editable", "site_packages", "expected"),
+        [
+            (True, True, True),
+            (False, True, False),
+            (False, False, True),
+        ],
+    )
+    def test_patched_is_user_import(self, wsfs_patch: Any, editable: bool, site_packages: bool, expected: bool) -> None:
+        """Test editable paths are allowed ahead of the site-packages check in both hook variants."""
+        test_dir = str(Path(__file__).parent)
+        site_dirs = [test_dir] if site_packages else []
+
+        # An unrelated editable path keeps the patched stack walk active in the non-editable cases
+        wsfs_patch._set_editable_paths({test_dir} if editable else {"/elsewhere/editable"})
+        modern_finder = _hook_double(site_dirs)
+        legacy_hook = _hook_double(site_dirs, legacy=True)
+
+        modern = wsfs_patch._create_patched_is_user_import_modern(lambda finder_self: True)
+        legacy = wsfs_patch._create_patched_is_user_import_legacy(lambda hook_self: True)
+        assert modern(modern_finder) is expected
+        assert legacy(legacy_hook) is expected
+
+        # Repeated calls are answered from the per-code-object verdict cache
+        assert wsfs_patch._frame_decisions
+        assert modern(modern_finder) is expected
+
+        wsfs_patch._set_editable_paths(set())
+        assert not wsfs_patch._frame_decisions
+
+    def test_patched_is_user_import_allow_list(self, wsfs_patch: Any) -> None:
+        """Test that allow-list substrings still let site-packages frames through."""
+        test_dir = str(Path(__file__).parent)
+
+        wsfs_patch._set_editable_paths({"/elsewhere/editable"})
+        legacy = wsfs_patch._create_patched_is_user_import_legacy(lambda hook_self: True)
+        modern = wsfs_patch._create_patched_is_user_import_modern(lambda finder_self: True)
+        # No refresh between iterations, so cached verdicts must follow the allow list
+        for allowed, expected in (([], False), (["no-such-dir", "unit"], True), ([], False)):
+            assert legacy(_hook_double([test_dir], allowed, legacy=True)) is expected
+            assert modern(_hook_double([test_dir], allowed)) is expected
+
+    def test_patched_is_user_import_verdicts_follow_hook_lists(self, wsfs_patch: Any) -> None:
+        """Test that a cached verdict is not reused for a hook with different lists."""
+        test_dir = str(Path(__file__).parent)
+
+        wsfs_patch._set_editable_paths({"/elsewhere/editable"})
+        modern = wsfs_patch._create_patched_is_user_import_modern(lambda finder_self: True)
+
+        for allowed, site_dirs, expected in (
+            ([], [test_dir], False),
+            ([], ["/nowhere"], True),
+            (["unit"], [test_dir], True),
+            ([], [test_dir], False),
+        ):
+            assert modern(_hook_double(site_dirs, allowed)) is expected
+
+    def test_patched_is_user_import_resolves_exec_frames(self, wsfs_patch: Any) -> None:
+        """Test that exec'd "<string>" frames are still mapped through get_filename."""
+        wsfs_patch._set_editable_paths({"/elsewhere/editable"})
+        finder = _hook_double(
+            ["/site-packages/"],
+            get_filename=lambda frame: frame.f_globals.get("__file__", frame.f_code.co_filename),
+        )
+        namespace = {
+            "__file__": "/site-packages/pkg/module.py",
+            "modern": wsfs_patch._create_patched_is_user_import_modern(lambda finder_self: True),
+            "finder": finder,
+        }
+
+        exec("result = modern(finder)", namespace)  # noqa: S102
+        assert namespace["result"] is False
+
+    def test_patched_is_user_import_resolves_each_code_object_once(self, wsfs_patch: Any) -> None:
+        """Test that get_filename is not called again for frames whose verdict is cached."""
+        from types import FrameType
+
+        test_dir = str(Path(__file__).parent)
+        resolved: list[str] = []
+
+        def get_filename(frame: FrameType) -> str:
+            resolved.append(frame.f_code.co_filename)
+            return frame.f_code.co_filename
+
+        wsfs_patch._set_editable_paths({"/elsewhere/editable"})
+        finder = _hook_double([test_dir], get_filename=get_filename)
+        modern = wsfs_patch._create_patched_is_user_import_modern(lambda finder_self: True)
+
+        assert modern(finder) is False
+        first_walk = len(resolved)
+        assert first_walk
+        assert modern(finder) is False
+        assert len(resolved) == first_walk
+
+    def test_patched_is_user_import_without_editable_paths(self, wsfs_patch: Any) -> None:
+        """Test that both hook variants defer to the original method when nothing is editable."""
+        hook = object()
+        calls: list[object] = []
+
+        def original(hook_self: object) -> bool:
+            calls.append(hook_self)
+            return False
+
+        modern = wsfs_patch._create_patched_is_user_import_modern(original)
+        assert modern(hook) is False
+        assert wsfs_patch._create_patched_is_user_import_legacy(original)(hook) is False
+        assert calls == [hook, hook]
+
+        # Paths detected after patching activate the stack walk without re-patching
+        test_dir = str(Path(__file__).parent)
+        wsfs_patch._set_editable_paths({test_dir})
+        assert modern(_hook_double([test_dir])) is True
+        assert calls == [hook, hook]
 
 
 class TestPythonPathHookPatch:
@@ -180,7 +570,28 @@ class TestPythonPathHookPatch:
         from dbx_patch.patches.python_path_hook_patch import PythonPathHookPatch
 
         paths = PythonPathHookPatch().get_editable_paths()
-        assert isinstance(paths, set)
+        assert isinstance(paths, frozenset)
+
+    def test_patched_method_restores_missing_paths(self, mock_sys_path: None) -> None:
+        """Test that the patched hook re-appends editable paths dropped from sys.path."""
+        from dbx_patch.patches.python_path_hook_patch import PythonPathHookPatch
+
+        PythonPathHookPatch.reset()
+        try:
+            patch = PythonPathHookPatch()
+            missing = [f"/editable/pkg{i}" for i in range(10)]
+            patch._set_editable_paths({missing[0], sys.path[0]})
+
+            patched = patch._create_patched_method(lambda hook_self: None)
+            patched(object())
+            assert sys.path.count(missing[0]) == 1
+
+            patch._set_editable_paths(set(missing))
+            patched(object())
+            assert all(sys.path.count(p) == 1 for p in missing)
+            assert sys.path[-9:] == missing[1:]
+        finally:
+            PythonPathHookPatch.reset()
 
 
 class TestApplyPatch:
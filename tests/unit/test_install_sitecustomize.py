@@ -3,6 +3,7 @@
 Tests the sitecustomize.py installation and auto-restart features.
 """
 
+import importlib.util
 from pathlib import Path
 import sys
 from unittest.mock import MagicMock, patch
@@ -39,6 +40,9 @@ class TestInstallSitecustomize:
         assert "dbx-patch" in content
         assert "_apply_dbx_patch" in content
 
+        # Check bytecode was precompiled next to it
+        assert Path(importlib.util.cache_from_source(str(sitecustomize_path))).exists()
+
     def test_install_sitecustomize_already_exists(self, temp_site_packages: Path) -> None:
         """Test installation when sitecustomize.py already exists."""
         from dbx_patch.install_sitecustomize import install_sitecustomize
@@ -72,6 +76,20 @@ class TestInstallSitecustomize:
         assert backup_path.exists()
         assert backup_path.read_text() == original_content
 
+    def test_install_sitecustomize_replaces_old_backup(self, temp_site_packages: Path) -> None:
+        """Test that a forced reinstall moves the current file over an existing backup."""
+        from dbx_patch.install_sitecustomize import get_sitecustomize_content, install_sitecustomize
+
+        (temp_site_packages / "sitecustomize.py").write_text("# Current content\n")
+        backup_path = temp_site_packages / "sitecustomize.py.backup"
+        backup_path.write_text("# Stale backup\n")
+
+        with patch("dbx_patch.install_sitecustomize.get_site_packages_path", return_value=temp_site_packages):
+            assert install_sitecustomize(restart_python=False, force=True) is True
+
+        assert backup_path.read_text() == "# Current content\n"
+        assert (temp_site_packages / "sitecustomize.py").read_text(encoding="utf-8") == get_sitecustomize_content()
+
     def test_install_sitecustomize_restart_python_true_databricks(self, temp_site_packages: Path) -> None:
         """Test automatic restart when in Databricks environment."""
         from dbx_patch.install_sitecustomize import install_sitecustomize
@@ -154,6 +172,7 @@ class TestInstallSitecustomize:
             result = uninstall_sitecustomize()
             assert result is True
             assert not sitecustomize_path.exists()
+            assert not Path(importlib.util.cache_from_source(str(sitecustomize_path))).exists()
 
     def test_uninstall_restores_backup(self, temp_site_packages: Path) -> None:
         """Test that uninstall restores backup file."""
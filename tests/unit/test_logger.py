@@ -0,0 +1,132 @@
+"""Test suite for the PatchLogger utility."""
+
+import logging
+
+import pytest
+
+from dbx_patch.utils.logger import PatchLogger
+
+
+@pytest.fixture
+def enabled_logger(monkeypatch: pytest.MonkeyPatch) -> PatchLogger:
+    """Create a PatchLogger with output enabled at DEBUG level."""
+    monkeypatch.setenv("DBX_PATCH_ENABLED", "1")
+    monkeypatch.setenv("DBX_PATCH_LOG_LEVEL", "DEBUG")
+    return PatchLogger(name="dbx-patch-test")
+
+
+class TestPatchLogger:
+    def test_lazy_format_args(self, enabled_logger: PatchLogger, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that %-style arguments are merged into the emitted message."""
+        enabled_logger.debug("Restoring path: %s", "/some/path")
+
+        assert "[DEBUG] Restoring path: /some/path" in caplog.messages
+
+    def test_percent_without_args(self, enabled_logger: PatchLogger, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that messages containing '%' are emitted verbatim without arguments."""
+        enabled_logger.info("%pip install -e /path/to/package")
+
+        assert "%pip install -e /path/to/package" in caplog.messages
+
+    def test_is_enabled_for(self, enabled_logger: PatchLogger, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that level checks honour both the enable flag and the configured level."""
+        assert enabled_logger.is_enabled_for(logging.DEBUG)
+
+        monkeypatch.setenv("DBX_PATCH_ENABLED", "0")
+        assert not PatchLogger(name="dbx-patch-test-disabled").is_enabled_for(logging.ERROR)
+
+    def test_bullets_single_record(self, enabled_logger: PatchLogger, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that a bullet list is emitted as one indented record."""
+        with enabled_logger.indent():
+            enabled_logger.bullets("Paths:", ["/a", "/b"])
+
+        assert caplog.messages == ["  Paths:\n    - /a\n    - /b"]
+
+    def test_nested_indent_restored(self, enabled_logger: PatchLogger, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that leaving nested indent blocks restores each outer indentation."""
+        with enabled_logger.indent():
+            with enabled_logger.indent(2):
+                enabled_logger.info("deep")
+            enabled_logger.info("one")
+        enabled_logger.info("top")
+
+        assert caplog.messages == ["      deep", "  one", "top"]
+
+    def test_disabled_logger_not_handed_out(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a disabled logger resolves to None once, until set_logger() swaps it."""
+        from dbx_patch import pth_processor
+        from dbx_patch.utils import logger as logger_module
+
+        monkeypatch.setattr(logger_module, "_default_logger", None)
+        monkeypatch.setattr(logger_module, "_enabled_logger", logger_module._UNRESOLVED)
+
+        monkeypatch.setenv("DBX_PATCH_ENABLED", "0")
+        logger_module.set_logger(PatchLogger(name="dbx-patch-test-disabled"))
+        assert pth_processor._get_logger() is None
+        assert logger_module._enabled_logger is None
+
+        monkeypatch.setenv("DBX_PATCH_ENABLED", "1")
+        enabled = PatchLogger(name="dbx-patch-test")
+        logger_module.set_logger(enabled)
+        assert pth_processor._get_logger() is enabled
+
+        logger_module.reset_logger()
+        assert logger_module._enabled_logger is logger_module._UNRESOLVED
+
+    def test_filtered_level_skips_prefixing(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that messages below the configured level are never formatted."""
+        monkeypatch.setenv("DBX_PATCH_ENABLED", "1")
+        monkeypatch.setenv("DBX_PATCH_LOG_LEVEL", "INFO")
+        logger = PatchLogger(name="dbx-patch-test-info")
+        formatted = []
+
+        class Message:
+            def __format__(self, spec: str) -> str:
+                formatted.append(spec)
+                return "message"
+
+        logger.debug(Message())  # type: ignore[arg-type]
+        assert formatted == []
+
+        logger.info(Message())  # type: ignore[arg-type]
+        assert formatted == [""]
+
+    def test_sections_when_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that disabled sections share one no-op context manager that still yields the logger."""
+        monkeypatch.setenv("DBX_PATCH_ENABLED", "0")
+        logger = PatchLogger(name="dbx-patch-test-disabled")
+
+        assert logger.section("A") is logger.subsection("B")
+        with logger.section("A") as section_logger:
+            assert section_logger is logger
+
+    def test_section_output(self, enabled_logger: PatchLogger, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that a section logs its title between separators and ends with a blank line."""
+        with enabled_logger.section("Title", length=3):
+            enabled_logger.info("body")
+
+        assert caplog.messages == ["===", "Title", "===", "body", ""]
+
+    def test_blank_lines_single_record(self, enabled_logger: PatchLogger, caplog: pytest.LogCaptureFixture) -> None:
+        """Test that several blank lines are emitted as one unindented record."""
+        with enabled_logger.indent():
+            enabled_logger.blank(3)
+            enabled_logger.blank(0)
+
+        assert caplog.messages == ["\n\n"]
+
+    def test_indent_when_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a disabled logger hands out its shared no-op context for indentation."""
+        monkeypatch.setenv("DBX_PATCH_ENABLED", "0")
+        logger = PatchLogger(name="dbx-patch-test-disabled")
+
+        with logger.indent() as indented:
+            assert indented is logger
+        assert logger.indent() is logger.section("A")
+
+    @pytest.mark.parametrize(("level_name", "expected"), [("debug", logging.DEBUG), ("BASIC_FORMAT", logging.ERROR)])
+    def test_log_level_from_env(self, monkeypatch: pytest.MonkeyPatch, level_name: str, expected: int) -> None:
+        """Test that only real level names are accepted from DBX_PATCH_LOG_LEVEL."""
+        monkeypatch.setenv("DBX_PATCH_LOG_LEVEL", level_name)
+
+        assert PatchLogger(name="dbx-patch-test-level")._logger.level == expected
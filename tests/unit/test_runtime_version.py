@@ -0,0 +1,43 @@
+"""Test suite for Databricks runtime version detection."""
+
+import pytest
+
+from dbx_patch.utils.runtime_version import is_runtime_version_gte, parse_version
+
+
+class TestRuntimeVersion:
+    @pytest.mark.parametrize(
+        ("version", "expected"),
+        [
+            ("18.0", (18, 0)),
+            ("14.3 LTS", (14, 3)),
+            ("client.1.2", None),
+            ("", None),
+            (None, None),
+        ],
+    )
+    def test_parse_version(self, version: str | None, expected: tuple[int, int] | None) -> None:
+        """Test parsing major and minor components from runtime version strings."""
+        assert parse_version(version) == expected
+        # A memoized repeat call returns the same answer
+        assert parse_version(version) == expected
+
+    @pytest.mark.parametrize(
+        ("version", "expected"),
+        [
+            ("17.3 LTS", False),
+            ("18.0", True),
+            ("18.1", True),
+        ],
+    )
+    def test_is_runtime_version_gte(self, monkeypatch: pytest.MonkeyPatch, version: str, expected: bool) -> None:
+        """Test comparing the current runtime version against DBR 18.0."""
+        monkeypatch.setenv("DATABRICKS_RUNTIME_VERSION", version)
+
+        assert is_runtime_version_gte(18, 0) is expected
+
+    def test_is_runtime_version_gte_outside_databricks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that an unknown runtime is treated as the newest one."""
+        monkeypatch.delenv("DATABRICKS_RUNTIME_VERSION", raising=False)
+
+        assert is_runtime_version_gte(18, 0) is True